@@ -2,14 +2,25 @@
 
 from .models import ConditionSnapshot
 from .normalization import ConditionNormalizer, DEFAULT_NORMALIZER
-from .scrapers import SCRAPERS, fetch_conditions
+from .scrapers import fetch_all, fetch_conditions, fetch_conditions_async, get_scrapers
 from .storage import ConditionStore
 
+__version__ = "0.1.0"
+
 __all__ = [
     "ConditionNormalizer",
     "ConditionSnapshot",
     "ConditionStore",
     "DEFAULT_NORMALIZER",
+    "fetch_all",
     "fetch_conditions",
+    "fetch_conditions_async",
+    "get_scrapers",
     "SCRAPERS",
 ]
+
+
+def __getattr__(name: str):
+    if name == "SCRAPERS":
+        return get_scrapers()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
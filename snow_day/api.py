@@ -1,29 +1,69 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import threading
 import uuid
-from datetime import datetime
-from typing import Dict, List, Optional
-
-from fastapi import FastAPI
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import fields
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from snow_day.cache import LastModifiedCache
-from snow_day.config import app_config
+from snow_day.config import get_config
+from snow_day.http_client import close_async_client
 from snow_day.logging import get_logger, setup_logging
 from snow_day.models import ConditionSnapshot
-from snow_day.resorts import ResortMeta, all_resorts, resort_lookup
-from snow_day.scheduler import build_scheduler
-from snow_day.scrapers import SCRAPERS, fetch_conditions
-from snow_day.services.llm_client import LLMClient, ScoredResort
+from snow_day.resorts import resort_index
+from snow_day.scrapers import fetch_conditions_async, get_scrapers
 from snow_day.services.scoring import ScoreResult, ScoringConfig, score_snapshot
 from snow_day.services.weather import fetch_current_weather
 from snow_day.storage import ConditionStore
 
-setup_logging(app_config.logging)
+if TYPE_CHECKING:
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+    from snow_day.services.llm_client import LLMClient, ScoredResort
+
 logger = get_logger(__name__)
 
-app = FastAPI(title="Snow Day API")
+_scheduler: Optional[AsyncIOScheduler] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    global _scheduler, _llm_client
+    config = get_config()
+    setup_logging(config.logging)
+
+    if _scheduler is None:
+        from snow_day.scheduler import build_scheduler
+
+        _scheduler = build_scheduler(refresh_and_score, config.scheduler)
+    if _scheduler and not _scheduler.running:
+        logger.info("scheduler.start")
+        _scheduler.start()
+    try:
+        yield
+    finally:
+        if _scheduler and _scheduler.running:
+            logger.info("scheduler.stop")
+            _scheduler.shutdown()
+        if _llm_client is not None:
+            _llm_client.close()
+            _llm_client = None
+        await close_async_client()
+
+
+app = FastAPI(title="Snow Day API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -35,6 +75,8 @@ app.add_middleware(
 
 
 class ConditionPayload(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     resort_id: str
     name: str
     state: str
@@ -56,6 +98,8 @@ class ConditionPayload(BaseModel):
 
 
 class RankingPayload(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     resort_id: str
     name: str
     state: str
@@ -67,27 +111,75 @@ class RankingPayload(BaseModel):
 
 
 class RankingsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     updated_at: Optional[datetime]
     rankings: List[RankingPayload]
     summary: str
 
 
 class ConditionsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     updated_at: Optional[datetime]
     resorts: List[ConditionPayload]
 
 
+def _json_response(payload: BaseModel) -> Response:
+    """Serialize with pydantic-core directly, skipping FastAPI's jsonable_encoder pass."""
+    return Response(content=payload.model_dump_json(), media_type="application/json")
+
+
 store = ConditionStore()
-cache = LastModifiedCache()
-llm_client = LLMClient()
-scoring_config = ScoringConfig.from_sources(config_data=app_config.scoring)
+_llm_client: Optional[LLMClient] = None
+_llm_client_lock = threading.Lock()
+
+# Payloads only change when a snapshot does, so reuse them across requests.
+# Keyed on every snapshot field, not just resort and timestamp: the weather
+# fallback and status inference fill fields in without touching the timestamp.
+# Bounded LRU; the lock covers handlers running in threads.
+_PAYLOAD_CACHE_SIZE = 256
+_payload_key = attrgetter(*(field.name for field in fields(ConditionSnapshot)))
+_payload_cache: "OrderedDict[Tuple[object, ...], ConditionPayload]" = OrderedDict()
+_payload_cache_lock = threading.Lock()
+# Last serialized /conditions body and its ETag, keyed on the payload keys of
+# the snapshots it was built from; guarded by _payload_cache_lock.
+_conditions_body: Optional[Tuple[Tuple[Tuple[object, ...], ...], bytes, str]] = None
+
+
+@lru_cache(maxsize=1)
+def _scraper_ids() -> Tuple[str, ...]:
+    return tuple(get_scrapers())
+
+
+@lru_cache(maxsize=1)
+def _scoring_config() -> ScoringConfig:
+    """Build the scoring config on first use so importing the API reads no config."""
+    return ScoringConfig.from_sources(config_data=get_config().scoring)
 
-_resorts: List[ResortMeta] = all_resorts()
-_resort_index: Dict[str, ResortMeta] = resort_lookup(_resorts)
+
+@lru_cache(maxsize=1)
+def _http_cache() -> LastModifiedCache:
+    """Open the HTTP validator cache next to the snapshot database on first use."""
+    return LastModifiedCache(store.db_path.parent / "http_cache.db")
+
+
+def _llm() -> LLMClient:
+    """Create the LLM client on first use so importing the API stays cheap."""
+    global _llm_client
+    if _llm_client is None:
+        # /rankings scores in worker threads; don't let two requests each build
+        # (and leak) a client.
+        with _llm_client_lock:
+            if _llm_client is None:
+                from snow_day.services.llm_client import LLMClient
+
+                _llm_client = LLMClient()
+    return _llm_client
 
 
 def _augment_with_weather(snapshot: ConditionSnapshot, *, trace_id: Optional[str] = None) -> ConditionSnapshot:
-    resort = _resort_index.get(snapshot.resort_id)
+    resort = resort_index().get(snapshot.resort_id)
     if not resort or resort.latitude is None or resort.longitude is None:
         return snapshot
 
@@ -123,86 +215,115 @@ def _augment_with_weather(snapshot: ConditionSnapshot, *, trace_id: Optional[str
 
 def _infer_operational_status(snapshot: ConditionSnapshot) -> ConditionSnapshot:
     """Infer operational status for ALL resorts, overriding incorrect False status.
-    
+
     If a resort has open trails or lifts, it MUST be open, regardless of what
     the scraper reported. This fixes cases where scrapers incorrectly mark
     resorts as closed.
     """
-    # Strongest signal: if trails or lifts are open, resort MUST be open
-    # This overrides any False status from scrapers
-    if (snapshot.trails_open or 0) > 0:
+    # Strongest signal: open trails or lifts override any False from the scraper.
+    if (snapshot.trails_open or 0) > 0 or (snapshot.lifts_open or 0) > 0:
         snapshot.is_operational = True
         return snapshot
-    
-    if (snapshot.lifts_open or 0) > 0:
+
+    # Only an unknown status is inferred from depth or fresh snow; an explicit
+    # True stays True and an explicit False without trail/lift data stays False.
+    if snapshot.is_operational is None and (
+        (snapshot.base_depth or 0) >= 6 or (snapshot.snowfall_24h or snapshot.snowfall_12h or 0) > 0
+    ):
         snapshot.is_operational = True
-        return snapshot
-    
-    # If already explicitly True, keep it
-    if snapshot.is_operational is True:
-        return snapshot
-    
-    # If status is unknown (None), try to infer from other signals
-    if snapshot.is_operational is None:
-        if (snapshot.base_depth or 0) >= 6:
-            snapshot.is_operational = True
-        elif (snapshot.snowfall_24h or snapshot.snowfall_12h or 0) > 0:
-            snapshot.is_operational = True
-    
-    # If status is False and we don't have trails/lifts data, leave it as False
-    # (resort might actually be closed)
     return snapshot
 
 
-def _snapshot_to_payload(snapshot: ConditionSnapshot) -> ConditionPayload:
-    resort = _resort_index.get(snapshot.resort_id)
-    return ConditionPayload(
-        resort_id=snapshot.resort_id,
-        name=resort.name if resort else snapshot.resort_id,
-        state=resort.state if resort else "",
-        timestamp=snapshot.timestamp,
-        wind_speed=snapshot.wind_speed,
-        wind_chill=snapshot.wind_chill,
-        temp_min=snapshot.temp_min,
-        temp_max=snapshot.temp_max,
-        snowfall_12h=snapshot.snowfall_12h,
-        snowfall_24h=snapshot.snowfall_24h,
-        snowfall_7d=snapshot.snowfall_7d,
-        base_depth=snapshot.base_depth,
-        precip_type=snapshot.precip_type,
-        is_operational=snapshot.is_operational,
-        lifts_open=snapshot.lifts_open,
-        lifts_total=snapshot.lifts_total,
-        trails_open=snapshot.trails_open,
-        trails_total=snapshot.trails_total,
-    )
+def _payload_fields(snapshot: ConditionSnapshot) -> Dict[str, object]:
+    resort = resort_index().get(snapshot.resort_id)
+    return {
+        "resort_id": snapshot.resort_id,
+        "name": resort.name if resort else snapshot.resort_id,
+        "state": resort.state if resort else "",
+        "timestamp": snapshot.timestamp,
+        "wind_speed": snapshot.wind_speed,
+        "wind_chill": snapshot.wind_chill,
+        "temp_min": snapshot.temp_min,
+        "temp_max": snapshot.temp_max,
+        "snowfall_12h": snapshot.snowfall_12h,
+        "snowfall_24h": snapshot.snowfall_24h,
+        "snowfall_7d": snapshot.snowfall_7d,
+        "base_depth": snapshot.base_depth,
+        "precip_type": snapshot.precip_type,
+        "is_operational": snapshot.is_operational,
+        "lifts_open": snapshot.lifts_open,
+        "lifts_total": snapshot.lifts_total,
+        "trails_open": snapshot.trails_open,
+        "trails_total": snapshot.trails_total,
+    }
+
+
+def _snapshots_to_payloads(snapshots: List[ConditionSnapshot]) -> List[ConditionPayload]:
+    """Return cached payloads, building any misses without re-validating our own fields."""
+    keys = [_payload_key(snapshot) for snapshot in snapshots]
+    payloads: List[Optional[ConditionPayload]] = []
+    misses: List[int] = []
+    with _payload_cache_lock:
+        for index, key in enumerate(keys):
+            hit = _payload_cache.get(key)
+            if hit is None:
+                misses.append(index)
+            else:
+                _payload_cache.move_to_end(key)
+            payloads.append(hit)
+
+    if misses:
+        built = [ConditionPayload.model_construct(**_payload_fields(snapshots[index])) for index in misses]
+        with _payload_cache_lock:
+            for index, payload in zip(misses, built):
+                payloads[index] = payload
+                _payload_cache[keys[index]] = payload
+            while len(_payload_cache) > _PAYLOAD_CACHE_SIZE:
+                _payload_cache.popitem(last=False)
+    return payloads  # type: ignore[return-value]
+
+
+def _invalidate_payloads(resort_id: str) -> None:
+    global _conditions_body
+    with _payload_cache_lock:
+        _conditions_body = None
+        for key in [key for key in _payload_cache if key[0] == resort_id]:
+            del _payload_cache[key]
 
 
 def _latest_snapshots() -> List[ConditionSnapshot]:
     """Get latest snapshots from storage and apply operational status inference."""
+    scraper_ids = _scraper_ids()
+    bundles = store.latest_with_previous(scraper_ids, previous=0)
     snapshots: List[ConditionSnapshot] = []
-    for resort_id in SCRAPERS.keys():
-        latest = store.get_latest(resort_id)
-        if latest:
+    for resort_id in scraper_ids:
+        bundle = bundles.get(resort_id)
+        if bundle:
             # Apply operational status inference to fix incorrect closed status
-            latest = _infer_operational_status(latest)
-            snapshots.append(latest)
+            snapshots.append(_infer_operational_status(bundle[0]))
     return snapshots
 
 
 def _score_resorts() -> RankingsResponse:
+    from snow_day.services.llm_client import ScoredResort
+
     ranked: List[RankingPayload] = []
     scored_resorts: List[ScoredResort] = []
-    snapshots = _latest_snapshots()
+    scraper_ids = _scraper_ids()
+    bundles = store.latest_with_previous(scraper_ids, previous=4)
     updated_at: Optional[datetime] = None
+    get_resort = resort_index().get
+    scoring_config = _scoring_config()
 
-    for snapshot in snapshots:
-        previous = store.list_snapshots(snapshot.resort_id, limit=5)[1:]
+    present = [bundles[resort_id] for resort_id in scraper_ids if resort_id in bundles]
+    snapshots = [_infer_operational_status(bundle[0]) for bundle in present]
+    payloads = _snapshots_to_payloads(snapshots)
+
+    for snapshot, (_, previous), payload in zip(snapshots, present, payloads):
         result: ScoreResult = score_snapshot(snapshot, previous_snapshots=previous, config=scoring_config)
-        payload = _snapshot_to_payload(snapshot)
-        resort = _resort_index.get(snapshot.resort_id)
+        resort = get_resort(snapshot.resort_id)
         ranked.append(
-            RankingPayload(
+            RankingPayload.model_construct(
                 resort_id=snapshot.resort_id,
                 name=resort.name if resort else snapshot.resort_id,
                 state=resort.state if resort else "",
@@ -235,61 +356,103 @@ def _score_resorts() -> RankingsResponse:
             updated_at = snapshot.timestamp
 
     ranked.sort(key=lambda item: item.score, reverse=True)
-    summary = llm_client.summarize_top_resorts(scored_resorts, top_n=3)
-    return RankingsResponse(updated_at=updated_at, rankings=ranked, summary=summary)
+    summary = _llm().summarize_top_resorts(scored_resorts, top_n=3)
+    return RankingsResponse.model_construct(updated_at=updated_at, rankings=ranked, summary=summary)
+
+
+# Upper bound on resort scrapes in flight at once during a refresh.
+REFRESH_CONCURRENCY = 8
+
 
+async def _refresh_one(resort_id: str, sem: asyncio.Semaphore, timestamp: datetime) -> None:
+    trace_id = uuid.uuid4().hex
+    try:
+        async with sem:
+            snapshot = await fetch_conditions_async(resort_id, cache=_http_cache(), trace_id=trace_id, timestamp=timestamp)
+        snapshot = await asyncio.to_thread(_augment_with_weather, snapshot, trace_id=trace_id)
+        snapshot = _infer_operational_status(snapshot)
+        await asyncio.to_thread(store.add_snapshot, snapshot)
+        _invalidate_payloads(resort_id)
+    except Exception as exc:  # pragma: no cover - surface partial refresh when scrapes fail
+        logger.error(
+            "refresh.error",
+            trace_id=trace_id,
+            resort_id=resort_id,
+            error=str(exc),
+        )
 
-def refresh_and_score() -> RankingsResponse:
+
+async def refresh_and_score() -> RankingsResponse:
     logger.info("refresh.start")
-    for resort_id in SCRAPERS.keys():
-        trace_id = uuid.uuid4().hex
-        try:
-            snapshot = fetch_conditions(resort_id, cache=cache, trace_id=trace_id)
-            snapshot = _augment_with_weather(snapshot, trace_id=trace_id)
-            snapshot = _infer_operational_status(snapshot)
-            store.add_snapshot(snapshot)
-        except Exception as exc:  # pragma: no cover - surface partial refresh when scrapes fail
-            logger.error(
-                "refresh.error",
-                trace_id=trace_id,
-                resort_id=resort_id,
-                error=str(exc),
-            )
-            continue
+    sem = asyncio.Semaphore(REFRESH_CONCURRENCY)
+    # One timestamp per refresh tick, shared by every snapshot parsed in it.
+    timestamp = datetime.now(timezone.utc)
+    tasks = [_refresh_one(resort_id, sem, timestamp) for resort_id in _scraper_ids()]
+    await asyncio.gather(*tasks, return_exceptions=True)
     logger.info("refresh.complete")
-    return _score_resorts()
+    # Scoring reads SQLite and may call the LLM synchronously; keep it off the event loop.
+    return await asyncio.to_thread(_score_resorts)
 
 
-@app.get("/conditions", response_model=ConditionsResponse)
-def get_conditions() -> ConditionsResponse:
-    snapshots = _latest_snapshots()
-    payloads = [_snapshot_to_payload(snapshot) for snapshot in snapshots]
-    updated_at = max((snapshot.timestamp for snapshot in snapshots), default=None)
-    return ConditionsResponse(updated_at=updated_at, resorts=payloads)
+def _conditions_etag(body: bytes) -> str:
+    # Hash the serialized body rather than resort/timestamp pairs: the weather
+    # fallback and status inference change fields without a new timestamp.
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
 
 
-@app.get("/rankings", response_model=RankingsResponse)
-def get_rankings() -> RankingsResponse:
-    return _score_resorts()
+def _conditions_body_and_etag(snapshots: List[ConditionSnapshot], updated_at: Optional[datetime]) -> Tuple[bytes, str]:
+    """Serialize and hash the conditions body once per distinct snapshot set."""
+    global _conditions_body
+    key = tuple(_payload_key(snapshot) for snapshot in snapshots)
+    with _payload_cache_lock:
+        cached = _conditions_body
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
 
+    payloads = _snapshots_to_payloads(snapshots)
+    body = ConditionsResponse.model_construct(updated_at=updated_at, resorts=payloads).model_dump_json().encode()
+    etag = _conditions_etag(body)
+    with _payload_cache_lock:
+        _conditions_body = (key, body, etag)
+    return body, etag
 
-@app.post("/refresh", response_model=RankingsResponse)
-def refresh_conditions() -> RankingsResponse:
-    return refresh_and_score()
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
 
-_scheduler = build_scheduler(refresh_and_score, app_config.scheduler)
 
+@app.get("/conditions", response_model=ConditionsResponse)
+async def get_conditions(request: Request) -> Response:
+    # Reading the latest snapshots queries SQLite; keep it off the event loop.
+    snapshots = await asyncio.to_thread(_latest_snapshots)
+    updated_at: Optional[datetime] = None
+    for snapshot in snapshots:
+        if updated_at is None or snapshot.timestamp > updated_at:
+            updated_at = snapshot.timestamp
 
-@app.on_event("startup")
-async def _start_scheduler() -> None:
-    if _scheduler and not _scheduler.running:
-        logger.info("scheduler.start")
-        _scheduler.start()
+    body, etag = _conditions_body_and_etag(snapshots, updated_at)
+    headers = {"ETag": etag}
+    if updated_at is not None:
+        if updated_at.tzinfo is None:
+            updated_at_utc = updated_at.replace(tzinfo=timezone.utc)
+        else:
+            updated_at_utc = updated_at.astimezone(timezone.utc)
+        headers["Last-Modified"] = format_datetime(updated_at_utc, usegmt=True)
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
-@app.on_event("shutdown")
-async def _stop_scheduler() -> None:
-    if _scheduler and _scheduler.running:
-        logger.info("scheduler.stop")
-        _scheduler.shutdown()
+@app.get("/rankings", response_model=RankingsResponse)
+async def get_rankings() -> Response:
+    return _json_response(await asyncio.to_thread(_score_resorts))
+
+
+@app.post("/refresh", response_model=RankingsResponse)
+async def refresh_conditions() -> Response:
+    return _json_response(await refresh_and_score())
+
@@ -1,34 +1,143 @@
 from __future__ import annotations
 
+import sqlite3
+import threading
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, Optional
 
+import orjson
+
 from .models import ConditionSnapshot
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     last_modified: Optional[str] = None
     snapshot: Optional[ConditionSnapshot] = None
+    etag: Optional[str] = None
+    digest: Optional[bytes] = None
 
 
 class LastModifiedCache:
-    """In-memory cache that tracks Last-Modified headers and parsed snapshots."""
+    """Tracks Last-Modified/ETag validators, body digests and parsed snapshots per URL.
+
+    Entries live in memory. When ``db_path`` is given they are also written
+    through to SQLite and loaded lazily on first use, so conditional requests
+    survive process restarts.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, db_path: Path | str | None = None) -> None:
         self._entries: Dict[str, CacheEntry] = {}
+        self.db_path = Path(db_path) if db_path is not None else None
+        self._loaded = self.db_path is None
+        self._load_lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether persisted entries have been read, so lookups no longer touch disk."""
+        return self._loaded
+
+    def _connect(self) -> sqlite3.Connection:
+        assert self.db_path is not None
+        return sqlite3.connect(self.db_path)
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        # Concurrent first lookups wait here for the rows instead of seeing an
+        # empty cache; _loaded only flips once the entries are in place.
+        with self._load_lock:
+            if self._loaded:
+                return
+            loaded = self._read_entries()
+            for url, entry in loaded.items():
+                # An update() that raced ahead of the load holds the newer entry.
+                self._entries.setdefault(url, entry)
+            self._loaded = True
+
+    def _read_entries(self) -> Dict[str, CacheEntry]:
+        assert self.db_path is not None
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    url TEXT PRIMARY KEY,
+                    last_modified TEXT,
+                    etag TEXT,
+                    snapshot TEXT,
+                    digest BLOB
+                )
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(http_cache)")}
+            if "digest" not in columns:
+                conn.execute("ALTER TABLE http_cache ADD COLUMN digest BLOB")
+            rows = conn.execute("SELECT url, last_modified, etag, snapshot, digest FROM http_cache").fetchall()
+        return {
+            url: CacheEntry(
+                last_modified=last_modified,
+                snapshot=ConditionSnapshot.from_dict(orjson.loads(snapshot)) if snapshot else None,
+                etag=etag,
+                digest=digest,
+            )
+            for url, last_modified, etag, snapshot, digest in rows
+        }
 
     def get_conditional_headers(self, url: str) -> Dict[str, str]:
+        self._ensure_loaded()
         entry = self._entries.get(url)
-        if entry and entry.last_modified:
-            return {"If-Modified-Since": entry.last_modified}
-        return {}
+        headers: Dict[str, str] = {}
+        if entry:
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+        return headers
 
-    def update(self, url: str, last_modified: Optional[str], snapshot: ConditionSnapshot) -> None:
-        self._entries[url] = CacheEntry(last_modified=last_modified, snapshot=snapshot)
+    def update(
+        self,
+        url: str,
+        last_modified: Optional[str],
+        snapshot: ConditionSnapshot,
+        *,
+        etag: Optional[str] = None,
+        digest: Optional[bytes] = None,
+    ) -> None:
+        self._ensure_loaded()
+        self._entries[url] = CacheEntry(last_modified=last_modified, snapshot=snapshot, etag=etag, digest=digest)
+        if self.db_path is not None:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO http_cache (url, last_modified, etag, snapshot, digest)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (
+                        url,
+                        last_modified,
+                        etag,
+                        orjson.dumps(snapshot, option=orjson.OPT_SERIALIZE_DATACLASS).decode(),
+                        digest,
+                    ),
+                )
 
     def get_snapshot(self, url: str) -> Optional[ConditionSnapshot]:
+        self._ensure_loaded()
         entry = self._entries.get(url)
         if entry:
             return entry.snapshot
         return None
+
+    def get_last_modified(self, url: str) -> Optional[str]:
+        self._ensure_loaded()
+        entry = self._entries.get(url)
+        if entry:
+            return entry.last_modified
+        return None
+
+    def get_digest(self, url: str) -> Optional[bytes]:
+        self._ensure_loaded()
+        entry = self._entries.get(url)
+        if entry:
+            return entry.digest
+        return None
@@ -1,15 +1,13 @@
 from __future__ import annotations
 
+import copy
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, Mapping, Optional
 
-import yaml
-from dotenv import load_dotenv
-
 _DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent / "config" / "defaults.yaml"
-load_dotenv()
 
 
 def _bool_from_env(value: str | None) -> Optional[bool]:
@@ -24,19 +22,46 @@ def _bool_from_env(value: str | None) -> Optional[bool]:
 
 
 def _merge_dicts(base: Dict, overrides: Mapping) -> Dict:
-    merged = dict(base)
-    for key, value in overrides.items():
-        if isinstance(value, Mapping) and isinstance(base.get(key), Mapping):
-            merged[key] = _merge_dicts(base[key], value)
-        else:
-            merged[key] = value
+    merged = copy.deepcopy(base)
+    stack = [(merged, overrides)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, Mapping) and isinstance(target.get(key), Mapping):
+                stack.append((target[key], value))
+            else:
+                target[key] = value
     return merged
 
 
 def _load_yaml(path: Path) -> Dict:
     if not path.exists():
         return {}
-    return yaml.safe_load(path.read_text()) or {}
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as Loader
+
+    return yaml.load(path.read_text(), Loader=Loader) or {}
+
+
+@lru_cache(maxsize=4)
+def _load_yaml_cached(path: Path, mtime_ns: int) -> Dict:
+    return _load_yaml(path)
+
+
+def _load_defaults() -> Dict:
+    """Return the bundled defaults, re-reading the file only when it changes.
+
+    load_config() mutates the nested sections, so callers get a deep copy.
+    """
+    try:
+        mtime_ns = _DEFAULT_CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return copy.deepcopy(_load_yaml_cached(_DEFAULT_CONFIG_PATH, mtime_ns))
 
 
 @dataclass
@@ -54,7 +79,7 @@ class LoggingConfig:
 @dataclass
 class ScraperSettings:
     report_url: str = ""
-    selectors: Dict[str, str] = field(default_factory=dict)
+    selectors: Mapping[str, str] = field(default_factory=dict)
 
 
 @dataclass
@@ -77,8 +102,12 @@ class AppConfig:
 
 
 def load_config(*, config_path: str | None = None, env: Mapping[str, str] | None = None) -> AppConfig:
+    if env is None:
+        from dotenv import load_dotenv
+
+        load_dotenv()
     env = dict(env or os.environ)
-    data = _load_yaml(_DEFAULT_CONFIG_PATH)
+    data = _load_defaults()
 
     explicit_path = config_path or env.get("SNOWDAY_CONFIG_PATH")
     if explicit_path:
@@ -124,4 +153,15 @@ def load_config(*, config_path: str | None = None, env: Mapping[str, str] | None
     )
 
 
-app_config = load_config()
+@lru_cache(maxsize=1)
+def get_config() -> AppConfig:
+    """Load the process-wide configuration on first use and reuse it afterwards."""
+    return load_config()
+
+
+def __getattr__(name: str):
+    # ``app_config`` used to be built at import time; keep the old name working
+    # without paying for the YAML and .env reads until someone asks for it.
+    if name == "app_config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-import time
+import asyncio
+import atexit
+import socket
 from typing import Dict, Optional
 
 import httpx
@@ -13,24 +15,119 @@ logger = get_logger(__name__)
 
 DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; SnowDayBot/1.0; +https://github.com/snowday)"
 
+# Connection failures (ConnectError / ConnectTimeout) are retried inside the
+# transport, which backs off between attempts. Read timeouts and other errors
+# raised after the request is sent are not retried, and a response of any
+# status is returned to the caller as-is.
+DEFAULT_RETRIES = 2
+
+# Keep connections to resort hosts open between scheduled refreshes so repeat
+# fetches skip the TCP and TLS handshakes.
+DEFAULT_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=300)
+
+# Requests are a single small write, so flush them immediately instead of
+# letting Nagle wait on the server's delayed ACK.
+DEFAULT_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+_SHARED_CLIENT: Optional[httpx.Client] = None
+_ASYNC_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _build_client(retries: int = DEFAULT_RETRIES) -> httpx.Client:
+    return httpx.Client(
+        transport=httpx.HTTPTransport(
+            http2=True,
+            retries=retries,
+            limits=DEFAULT_LIMITS,
+            socket_options=DEFAULT_SOCKET_OPTIONS,
+        ),
+        timeout=10.0,
+        headers={"User-Agent": DEFAULT_USER_AGENT},
+        cookies=httpx.Cookies(),
+    )
+
+
+def _build_async_client(retries: int = DEFAULT_RETRIES) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=retries,
+            limits=DEFAULT_LIMITS,
+            socket_options=DEFAULT_SOCKET_OPTIONS,
+        ),
+        timeout=10.0,
+        headers={"User-Agent": DEFAULT_USER_AGENT},
+        cookies=httpx.Cookies(),
+    )
+
+
+def _resolve_retries(retries: Optional[int], max_attempts: Optional[int]) -> int:
+    if max_attempts is not None:
+        if retries is not None:
+            raise TypeError("Pass either retries or max_attempts, not both")
+        return max(max_attempts - 1, 0)
+    return DEFAULT_RETRIES if retries is None else retries
+
+
+def get_shared_client() -> httpx.Client:
+    """Return the process-wide sync client so every fetcher shares one pool."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        _SHARED_CLIENT = _build_client()
+    return _SHARED_CLIENT
+
+
+def _close_shared_client() -> None:
+    if _SHARED_CLIENT is not None:
+        _SHARED_CLIENT.close()
+
+
+# Registered once; closes whichever shared client is current at exit.
+atexit.register(_close_shared_client)
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the process-wide async client so concurrent refreshes share one pool."""
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None or _ASYNC_CLIENT.is_closed:
+        _ASYNC_CLIENT = _build_async_client()
+    return _ASYNC_CLIENT
+
+
+async def close_async_client() -> None:
+    """Close the shared async client; the next :func:`get_async_client` builds a new one."""
+    global _ASYNC_CLIENT
+    client, _ASYNC_CLIENT = _ASYNC_CLIENT, None
+    if client is not None:
+        await client.aclose()
+
 
 class HttpFetcher:
-    """HTTP client wrapper with retry/backoff and Last-Modified caching."""
+    """HTTP client wrapper with transport-level retries and Last-Modified caching.
+
+    ``retries`` is how many times a failed connection is retried inside the
+    transport (default :data:`DEFAULT_RETRIES`). Only connection failures are
+    retried: read timeouts and other errors raised after the request is sent
+    propagate on the first attempt. ``max_attempts`` is still accepted and maps
+    to ``retries=max_attempts - 1``. Both only shape the fetcher's own client;
+    a ``client`` passed in keeps its transport as-is.
+    """
 
     def __init__(
         self,
         client: Optional[httpx.Client] = None,
         *,
-        max_attempts: int = 3,
-        backoff_factor: float = 0.5,
+        retries: Optional[int] = None,
+        max_attempts: Optional[int] = None,
         cache: Optional[LastModifiedCache] = None,
     ) -> None:
-        self.client = client or httpx.Client(
-            timeout=10.0,
-            headers={"User-Agent": DEFAULT_USER_AGENT},
-        )
-        self.max_attempts = max_attempts
-        self.backoff_factor = backoff_factor
+        retries = _resolve_retries(retries, max_attempts)
+        if client is None:
+            client = get_shared_client() if retries == DEFAULT_RETRIES else _build_client(retries)
+        self.client = client
         self.cache = cache or LastModifiedCache()
 
     def fetch(
@@ -41,25 +138,41 @@ class HttpFetcher:
         if extra_headers:
             headers.update(extra_headers)
 
-        last_error: Optional[Exception] = None
-        for attempt in range(1, self.max_attempts + 1):
-            try:
-                logger.info("http.fetch", trace_id=trace_id, url=url, attempt=attempt)
-                response = self.client.get(url, headers=headers)
-                return response
-            except httpx.RequestError as exc:  # pragma: no cover - network failure path
-                last_error = exc
-                logger.warning(
-                    "http.fetch.retry",
-                    trace_id=trace_id,
-                    url=url,
-                    attempt=attempt,
-                    error=str(exc),
-                )
-                if attempt == self.max_attempts:
-                    raise
-                sleep_for = self.backoff_factor * (2 ** (attempt - 1))
-                time.sleep(sleep_for)
-        if last_error:
-            raise last_error
-        raise RuntimeError("Unexpected fetch state")
+        logger.info("http.fetch", trace_id=trace_id, url=url)
+        return self.client.get(url, headers=headers)
+
+
+class AsyncHttpFetcher:
+    """Async variant of :class:`HttpFetcher` so resort fetches can overlap.
+
+    ``retries`` and ``max_attempts`` behave as for :class:`HttpFetcher`.
+    """
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        *,
+        retries: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        cache: Optional[LastModifiedCache] = None,
+    ) -> None:
+        retries = _resolve_retries(retries, max_attempts)
+        if client is None:
+            client = get_async_client() if retries == DEFAULT_RETRIES else _build_async_client(retries)
+        self.client = client
+        self.cache = cache or LastModifiedCache()
+
+    async def fetch(
+        self, url: str, *, extra_headers: Optional[Dict[str, str]] = None, trace_id: str | None = None
+    ) -> httpx.Response:
+        headers: Dict[str, str] = {}
+        if self.cache.is_loaded:
+            headers.update(self.cache.get_conditional_headers(url))
+        else:
+            # The first lookup reads the persisted cache from SQLite; keep it off the loop.
+            headers.update(await asyncio.to_thread(self.cache.get_conditional_headers, url))
+        if extra_headers:
+            headers.update(extra_headers)
+
+        logger.info("http.fetch", trace_id=trace_id, url=url)
+        return await self.client.get(url, headers=headers)
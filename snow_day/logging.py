@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import logging as py_logging
+import sys
 from typing import Optional
 
+import orjson
 import structlog
 
-from snow_day.config import LoggingConfig, app_config
+from snow_day.config import LoggingConfig, get_config
 
 _configured = False
 
@@ -15,7 +17,7 @@ def setup_logging(config: Optional[LoggingConfig] = None) -> None:
     if _configured:
         return
 
-    config = config or app_config.logging
+    config = config or get_config().logging
     level = getattr(py_logging, str(config.level).upper(), py_logging.INFO)
 
     timestamper = structlog.processors.TimeStamper(fmt="iso")
@@ -27,10 +29,16 @@ def setup_logging(config: Optional[LoggingConfig] = None) -> None:
             timestamper,
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer() if config.json else structlog.dev.ConsoleRenderer(),
+            structlog.processors.JSONRenderer(serializer=orjson.dumps)
+            if config.json
+            else structlog.dev.ConsoleRenderer(),
         ],
         wrapper_class=structlog.make_filtering_bound_logger(level),
-        logger_factory=structlog.stdlib.LoggerFactory(),
+        # orjson renders bytes; write them straight to stdout instead of
+        # decoding back to str for the stdlib logging handlers.
+        logger_factory=structlog.BytesLoggerFactory(sys.stdout.buffer)
+        if config.json
+        else structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
@@ -38,7 +46,7 @@ def setup_logging(config: Optional[LoggingConfig] = None) -> None:
     _configured = True
 
 
-def get_logger(name: str = __name__):
-    if not _configured:
-        setup_logging()
-    return structlog.get_logger(name)
+# structlog hands back a lazy proxy that resolves its configuration on the
+# first log call, so module-level loggers pick up setup_logging() even when it
+# runs later from the app lifespan. Alias it directly; a wrapper adds nothing.
+get_logger = structlog.get_logger
@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Mapping, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ConditionSnapshot:
     """Normalized snow condition metrics for a resort.
 
@@ -32,10 +32,10 @@ class ConditionSnapshot:
     trails_total: Optional[int] = None
 
     @staticmethod
-    def now(resort_id: str, **kwargs: object) -> "ConditionSnapshot":
+    def now(resort_id: str, *, timestamp: Optional[datetime] = None, **kwargs: object) -> "ConditionSnapshot":
         return ConditionSnapshot(
             resort_id=resort_id,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=timestamp or datetime.now(timezone.utc),
             **kwargs,
         )
 
@@ -2,14 +2,53 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
 
 from .models import ConditionSnapshot
 
 Converter = Callable[[Any], Any]
+CompiledNormalizer = Callable[[Mapping[str, Any], datetime], ConditionSnapshot]
+
+_now = datetime.now
+_UTC = timezone.utc
+
+_SNAPSHOT_FIELDS = (
+    "wind_speed",
+    "wind_chill",
+    "temp_min",
+    "temp_max",
+    "snowfall_12h",
+    "snowfall_24h",
+    "snowfall_7d",
+    "base_depth",
+    "precip_type",
+    "lifts_open",
+    "lifts_total",
+    "trails_open",
+    "trails_total",
+    "is_operational",
+)
+
+
+def _kph_to_mph(value: Any, _factor: float = 0.621371) -> Optional[float]:
+    if value is None:
+        return None
+    return float(value) * _factor
+
 
+def _cm_to_inches(value: Any, _factor: float = 0.393701) -> Optional[float]:
+    if value is None:
+        return None
+    return float(value) * _factor
 
-@dataclass(frozen=True)
+
+def _c_to_f(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    return (float(value) * 9 / 5) + 32
+
+
+@dataclass(frozen=True, slots=True)
 class FieldMapping:
     """Describes how to pull and transform a raw metric into a normalized field."""
 
@@ -31,24 +70,11 @@ class ConditionNormalizer:
 
     def __init__(self, mappings: Mapping[str, Mapping[str, FieldMapping]]) -> None:
         self._mappings: Dict[str, Mapping[str, FieldMapping]] = dict(mappings)
+        self._compiled: Dict[str, CompiledNormalizer] = {}
 
-    @staticmethod
-    def _kph_to_mph(value: Any) -> Optional[float]:
-        if value is None:
-            return None
-        return float(value) * 0.621371
-
-    @staticmethod
-    def _cm_to_inches(value: Any) -> Optional[float]:
-        if value is None:
-            return None
-        return float(value) * 0.393701
-
-    @staticmethod
-    def _c_to_f(value: Any) -> Optional[float]:
-        if value is None:
-            return None
-        return (float(value) * 9 / 5) + 32
+    _kph_to_mph = staticmethod(_kph_to_mph)
+    _cm_to_inches = staticmethod(_cm_to_inches)
+    _c_to_f = staticmethod(_c_to_f)
 
     def normalize(
         self,
@@ -57,32 +83,59 @@ class ConditionNormalizer:
         *,
         timestamp: Optional[datetime] = None,
     ) -> ConditionSnapshot:
-        mapping = self._mappings.get(resort_id, {})
+        compiled = self._compiled.get(resort_id)
+        if compiled is None:
+            compiled = self._compiled[resort_id] = self._compile(resort_id)
+        return compiled(payload, timestamp or _now(_UTC))
 
-        def resolve(field: str) -> Any:
+    def normalize_batch(
+        self,
+        resort_id: str,
+        payloads: Iterable[Mapping[str, Any]],
+        *,
+        timestamp: Optional[datetime] = None,
+    ) -> List[ConditionSnapshot]:
+        """Normalize many payloads for one resort, sharing a single timestamp.
+
+        The specialized function is resolved once for the whole batch instead
+        of once per payload.
+        """
+        compiled = self._compiled.get(resort_id)
+        if compiled is None:
+            compiled = self._compiled[resort_id] = self._compile(resort_id)
+        timestamp = timestamp or _now(_UTC)
+        return [compiled(payload, timestamp) for payload in payloads]
+
+    def _compile(self, resort_id: str) -> CompiledNormalizer:
+        """Generate a normalizer specialized to one resort's field mapping.
+
+        Each :class:`FieldMapping` is unpacked here, once: plain renames become
+        direct ``payload.get`` calls and transforms/converters are bound as
+        globals of the generated function, so normalizing never touches the
+        mapping objects.
+        """
+        mapping = self._mappings.get(resort_id, {})
+        namespace: Dict[str, Any] = {"ConditionSnapshot": ConditionSnapshot, "resort_id": resort_id}
+        body = ["def _normalize(payload, timestamp):", "    get = payload.get"]
+        for field in _SNAPSHOT_FIELDS:
             spec = mapping.get(field)
-            if spec:
-                return spec.extract(payload)
-            return payload.get(field)
-
-        return ConditionSnapshot(
-            resort_id=resort_id,
-            timestamp=timestamp or datetime.now(timezone.utc),
-            wind_speed=resolve("wind_speed"),
-            wind_chill=resolve("wind_chill"),
-            temp_min=resolve("temp_min"),
-            temp_max=resolve("temp_max"),
-            snowfall_12h=resolve("snowfall_12h"),
-            snowfall_24h=resolve("snowfall_24h"),
-            snowfall_7d=resolve("snowfall_7d"),
-            base_depth=resolve("base_depth"),
-            precip_type=resolve("precip_type"),
-            lifts_open=resolve("lifts_open"),
-            lifts_total=resolve("lifts_total"),
-            trails_open=resolve("trails_open"),
-            trails_total=resolve("trails_total"),
-            is_operational=resolve("is_operational"),
-        )
+            if not spec:
+                body.append(f"    {field} = get({field!r})")
+                continue
+            value = f"get({spec.source!r})"
+            if spec.transform:
+                namespace[f"_transform_{field}"] = spec.transform
+                value = f"_transform_{field}({value})"
+            body.append(f"    {field} = {value}")
+            if spec.converter:
+                namespace[f"_convert_{field}"] = spec.converter
+                body.append(f"    if {field} is not None:")
+                body.append(f"        {field} = _convert_{field}({field})")
+
+        fields = ", ".join(f"{field}={field}" for field in _SNAPSHOT_FIELDS)
+        body.append(f"    return ConditionSnapshot(resort_id=resort_id, timestamp=timestamp, {fields})")
+        exec(compile("\n".join(body) + "\n", f"<normalizer {resort_id}>", "exec"), namespace)
+        return namespace["_normalize"]
 
 
 # Standard field mapping for resorts using imperial units
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
-from snow_day.config import app_config
+from snow_day.config import get_config
 
 
-@dataclass
+@dataclass(slots=True)
 class ResortMeta:
     """Lightweight metadata for known resorts."""
 
@@ -18,13 +20,15 @@ class ResortMeta:
     longitude: Optional[float] = None
 
 
-def all_resorts() -> List[ResortMeta]:
-    """Build a list of resorts using configured scraper report URLs."""
+@lru_cache(maxsize=1)
+def all_resorts() -> Tuple[ResortMeta, ...]:
+    """Build the resorts from configured scraper report URLs, once per process."""
 
+    config = get_config()
     resorts: List[ResortMeta] = []
-    for resort in app_config.resorts:
+    for resort in config.resorts:
         scraper_id = resort.scraper or resort.id
-        scraper_settings = app_config.scrapers.get(scraper_id)
+        scraper_settings = config.scrapers.get(scraper_id)
         report_url = scraper_settings.report_url if scraper_settings else ""
         resorts.append(
             ResortMeta(
@@ -36,8 +40,14 @@ def all_resorts() -> List[ResortMeta]:
                 longitude=resort.longitude,
             )
         )
-    return resorts
+    return tuple(resorts)
 
 
 def resort_lookup(resorts: Iterable[ResortMeta]) -> Dict[str, ResortMeta]:
     return {resort.id: resort for resort in resorts}
+
+
+@lru_cache(maxsize=1)
+def resort_index() -> Mapping[str, ResortMeta]:
+    """Read-only ``resort_id -> ResortMeta`` lookup for :func:`all_resorts`."""
+    return MappingProxyType(resort_lookup(all_resorts()))
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Callable, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -11,7 +11,7 @@ from snow_day.logging import get_logger
 logger = get_logger(__name__)
 
 
-def build_scheduler(job: Callable[[], None], config: SchedulerConfig) -> Optional[AsyncIOScheduler]:
+def build_scheduler(job: Callable[[], Awaitable[Any]], config: SchedulerConfig) -> Optional[AsyncIOScheduler]:
     if not config.enabled:
         logger.info("scheduler.disabled")
         return None
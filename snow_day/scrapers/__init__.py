@@ -1,174 +1,291 @@
 from __future__ import annotations
 
-from functools import partial
-from typing import Callable, Dict, Tuple
+import asyncio
+import contextvars
+import hashlib
+import importlib
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType, ModuleType
+from typing import Callable, Dict, Iterable, Mapping, Optional, Tuple
 import uuid
 
 import httpx
 
-from snow_day.config import ScraperSettings, app_config
+from snow_day.config import ScraperSettings, get_config
 from snow_day.logging import get_logger
 
 from ..cache import LastModifiedCache
-from ..http_client import HttpFetcher
+from ..http_client import DEFAULT_RETRIES, AsyncHttpFetcher, HttpFetcher, get_shared_client
 from ..models import ConditionSnapshot
-from . import (
-    alpine_peak,
-    bolton_valley,
-    cannon_mountain,
-    jay_peak,
-    killington,
-    loon_mountain,
-    okemo,
-    pats_peak,
-    pico,
-    ragged_mountain,
-    saddleback,
-    stratton,
-    sugarbush,
-    sugarloaf,
-    summit_valley,
-    sunday_river,
-    waterville_valley,
-)
 
 logger = get_logger(__name__)
 
-Scraper = Tuple[str, Callable[[str], ConditionSnapshot]]
-
-_PARSERS: Dict[str, Callable[..., ConditionSnapshot]] = {
-    alpine_peak.RESORT_ID: alpine_peak.parse_conditions,
-    bolton_valley.RESORT_ID: bolton_valley.parse_conditions,
-    cannon_mountain.RESORT_ID: cannon_mountain.parse_conditions,
-    jay_peak.RESORT_ID: jay_peak.parse_conditions,
-    killington.RESORT_ID: killington.parse_conditions,
-    loon_mountain.RESORT_ID: loon_mountain.parse_conditions,
-    okemo.RESORT_ID: okemo.parse_conditions,
-    pats_peak.RESORT_ID: pats_peak.parse_conditions,
-    pico.RESORT_ID: pico.parse_conditions,
-    ragged_mountain.RESORT_ID: ragged_mountain.parse_conditions,
-    saddleback.RESORT_ID: saddleback.parse_conditions,
-    stratton.RESORT_ID: stratton.parse_conditions,
-    sugarbush.RESORT_ID: sugarbush.parse_conditions,
-    sugarloaf.RESORT_ID: sugarloaf.parse_conditions,
-    summit_valley.RESORT_ID: summit_valley.parse_conditions,
-    sunday_river.RESORT_ID: sunday_river.parse_conditions,
-    waterville_valley.RESORT_ID: waterville_valley.parse_conditions,
-}
+# parser(html, *, timestamp=None) -> ConditionSnapshot
+Parser = Callable[..., ConditionSnapshot]
+Scraper = Tuple[str, Parser]
+
+# Each scraper lives in a submodule named after the resort it handles. They are
+# imported on first use so a single-resort caller only loads its own parser.
+_SCRAPER_MODULES: Tuple[str, ...] = (
+    "alpine_peak",
+    "bolton_valley",
+    "cannon_mountain",
+    "jay_peak",
+    "killington",
+    "loon_mountain",
+    "okemo",
+    "pats_peak",
+    "pico",
+    "ragged_mountain",
+    "saddleback",
+    "stratton",
+    "sugarbush",
+    "sugarloaf",
+    "summit_valley",
+    "sunday_river",
+    "waterville_valley",
+)
+
+
+@lru_cache(maxsize=None)
+def _scraper_module(scraper_id: str) -> Optional[ModuleType]:
+    if scraper_id not in _SCRAPER_MODULES:
+        return None
+    return importlib.import_module(f"{__name__}.{scraper_id}")
 
 
+@lru_cache(maxsize=None)
 def _settings_for(resort_id: str) -> ScraperSettings:
+    """Resolve a resort's scraper settings once; the selectors are read-only and shared."""
+    module = _scraper_module(resort_id)
     defaults = None
-    if resort_id == alpine_peak.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=alpine_peak.DEFAULT_REPORT_URL,
-            selectors=dict(alpine_peak.DEFAULT_SELECTORS),
-        )
-    elif resort_id == summit_valley.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=summit_valley.DEFAULT_REPORT_URL,
-            selectors=dict(summit_valley.DEFAULT_SELECTORS),
-        )
-    elif resort_id == cannon_mountain.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=cannon_mountain.DEFAULT_REPORT_URL,
-            selectors={},
-        )
-    elif resort_id == okemo.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=okemo.DEFAULT_REPORT_URL,
-            selectors={},
-        )
-    elif resort_id == waterville_valley.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=waterville_valley.DEFAULT_REPORT_URL,
-            selectors={},
-        )
-    elif resort_id == ragged_mountain.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=ragged_mountain.DEFAULT_REPORT_URL,
-            selectors={},
-        )
-    elif resort_id == pats_peak.RESORT_ID:
+    if module is not None:
         defaults = ScraperSettings(
-            report_url=pats_peak.DEFAULT_REPORT_URL,
-            selectors={},
+            report_url=module.DEFAULT_REPORT_URL,
+            selectors=MappingProxyType(dict(getattr(module, "DEFAULT_SELECTORS", {}))),
         )
-    elif resort_id == loon_mountain.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=loon_mountain.DEFAULT_REPORT_URL,
-            selectors={},
-        )
-    elif resort_id == jay_peak.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=jay_peak.DEFAULT_REPORT_URL,
-            selectors={},
-        )
-    elif resort_id == bolton_valley.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=bolton_valley.DEFAULT_REPORT_URL,
-            selectors={},
-        )
-    elif resort_id == killington.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=killington.DEFAULT_REPORT_URL,
-            selectors={},
-        )
-    elif resort_id == pico.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=pico.DEFAULT_REPORT_URL,
-            selectors={},
-        )
-    elif resort_id == sugarbush.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=sugarbush.DEFAULT_REPORT_URL,
-            selectors={},
-        )
-    elif resort_id == stratton.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=stratton.DEFAULT_REPORT_URL,
-            selectors={},
-        )
-    elif resort_id == saddleback.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=saddleback.DEFAULT_REPORT_URL,
-            selectors={},
-        )
-    elif resort_id == sugarloaf.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=sugarloaf.DEFAULT_REPORT_URL,
-            selectors={},
-        )
-    elif resort_id == sunday_river.RESORT_ID:
-        defaults = ScraperSettings(
-            report_url=sunday_river.DEFAULT_REPORT_URL,
-            selectors={},
-        )
-    configured = app_config.scrapers.get(resort_id)
+    configured = get_config().scrapers.get(resort_id)
     if not configured:
         return defaults or ScraperSettings()
     if defaults:
-        merged_selectors = {**defaults.selectors, **configured.selectors}
+        merged_selectors = MappingProxyType({**defaults.selectors, **configured.selectors})
         return ScraperSettings(report_url=configured.report_url or defaults.report_url, selectors=merged_selectors)
-    return configured
+    return ScraperSettings(
+        report_url=configured.report_url,
+        selectors=MappingProxyType(dict(configured.selectors)),
+    )
+
+
+def _bind_selectors(parser: Parser, selectors: Mapping[str, str]) -> Parser:
+    # A plain closure instead of functools.partial: partial copies its stored
+    # keywords into a fresh dict on every call.
+    def _parse(html: str | bytes, *, timestamp: datetime | None = None) -> ConditionSnapshot:
+        return parser(html, selectors=selectors, timestamp=timestamp)
+
+    return _parse
+
+
+def _make_scraper(scraper_id: str) -> Optional[Scraper]:
+    module = _scraper_module(scraper_id)
+    settings = _settings_for(scraper_id)
+    if module is None or not settings.report_url:
+        return None
+    return settings.report_url, _bind_selectors(module.parse_conditions, settings.selectors)
 
 
 def _build_scrapers() -> Dict[str, Scraper]:
     scrapers: Dict[str, Scraper] = {}
-    for resort in app_config.resorts:
-        scraper_id = resort.scraper or resort.id
-        parser = _PARSERS.get(scraper_id)
-        settings = _settings_for(scraper_id)
-        if not parser or not settings.report_url:
-            continue
-        scrapers[resort.id] = (
-            settings.report_url,
-            partial(parser, selectors=settings.selectors),
-        )
+    for resort in get_config().resorts:
+        scraper = _RESOLVED.get(resort.id) or _make_scraper(resort.scraper or resort.id)
+        if scraper is not None:
+            scrapers[resort.id] = scraper
     return scrapers
 
 
-SCRAPERS: Dict[str, Scraper] = _build_scrapers()
+_SCRAPERS: Optional[Dict[str, Scraper]] = None
+# Scrapers resolved one at a time before the full registry was built; reused by
+# _build_scrapers so both paths hand out the same instance per resort.
+_RESOLVED: Dict[str, Scraper] = {}
+
+
+def get_scrapers() -> Dict[str, Scraper]:
+    """Return ``resort_id -> (report_url, parser)`` for every configured resort."""
+    global _SCRAPERS
+    if _SCRAPERS is None:
+        _SCRAPERS = _build_scrapers()
+    return _SCRAPERS
+
+
+def _scraper_for(resort_id: str) -> Optional[Scraper]:
+    if _SCRAPERS is not None:
+        return _SCRAPERS.get(resort_id)
+    scraper = _RESOLVED.get(resort_id)
+    if scraper is None:
+        for resort in get_config().resorts:
+            if resort.id == resort_id:
+                scraper = _make_scraper(resort.scraper or resort.id)
+                break
+        # Unknown ids aren't remembered, so arbitrary ids can't grow the registry.
+        if scraper is not None:
+            _RESOLVED[resort_id] = scraper
+    return scraper
+
+
+def __getattr__(name: str):
+    # SCRAPERS used to be built at import time; build it on first access instead.
+    if name == "SCRAPERS":
+        return get_scrapers()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _lookup_scraper(resort_id: str, trace_id: str) -> Scraper:
+    scraper = _scraper_for(resort_id)
+    if scraper is None:
+        logger.error("scrape.unknown_resort", trace_id=trace_id, resort_id=resort_id)
+        raise KeyError(f"Unknown resort_id: {resort_id}")
+    return scraper
+
+
+_UTF8_CHARSETS = frozenset({"utf-8", "utf8", "ascii", "us-ascii"})
+
+
+def _response_body(response: httpx.Response) -> str | bytes:
+    # Parsers take UTF-8 bytes as-is, which skips httpx's str decode (and the
+    # second copy of the page it makes). httpx also falls back to UTF-8 when no
+    # charset is declared, so only a non-UTF-8 charset needs decoding here.
+    charset = response.charset_encoding
+    if charset is None or charset.lower() in _UTF8_CHARSETS:
+        return response.content
+    return response.text
+
+
+def _snapshot_from_response(
+    resort_id: str,
+    url: str,
+    parser: Parser,
+    response: httpx.Response,
+    cache: LastModifiedCache,
+    trace_id: str,
+    timestamp: datetime | None = None,
+) -> ConditionSnapshot:
+    cached_snapshot = cache.get_snapshot(url)
+    if response.status_code == 304:
+        if cached_snapshot:
+            logger.info(
+                "scrape.cache_hit",
+                trace_id=trace_id,
+                resort_id=resort_id,
+                url=url,
+            )
+            return cached_snapshot
+        raise RuntimeError("Received 304 but no cached snapshot is available")
+
+    response.raise_for_status()
+    last_modified = response.headers.get("Last-Modified")
+    if cached_snapshot and last_modified and last_modified == cache.get_last_modified(url):
+        # Servers that ignore If-Modified-Since still tell us the page is unchanged.
+        logger.info(
+            "scrape.unchanged",
+            trace_id=trace_id,
+            resort_id=resort_id,
+            url=url,
+        )
+        return cached_snapshot
+
+    etag = response.headers.get("ETag")
+    digest = hashlib.blake2b(response.content, digest_size=16).digest()
+    if cached_snapshot and digest == cache.get_digest(url):
+        # Byte-identical body: keep the parsed snapshot, refresh the validators.
+        cache.update(url, last_modified, cached_snapshot, etag=etag, digest=digest)
+        logger.info(
+            "scrape.unchanged",
+            trace_id=trace_id,
+            resort_id=resort_id,
+            url=url,
+        )
+        return cached_snapshot
+
+    snapshot = parser(_response_body(response), timestamp=timestamp)
+    cache.update(
+        url,
+        last_modified,
+        snapshot,
+        etag=etag,
+        digest=digest,
+    )
+    logger.info(
+        "scrape.success",
+        trace_id=trace_id,
+        resort_id=resort_id,
+        url=url,
+        status_code=response.status_code,
+    )
+    return snapshot
+
+
+# Callers that pass neither a client nor a cache share one fetcher (and so the
+# pooled client) plus one validator cache, so repeat calls still send
+# If-Modified-Since / If-None-Match. httpx clients are safe to share across threads.
+_DEFAULT_CACHE = LastModifiedCache()
+_DEFAULT_FETCHER: HttpFetcher | None = None
+
+
+def _resolve_cache(client: object | None, cache: LastModifiedCache | None) -> LastModifiedCache:
+    # Only fully default calls share _DEFAULT_CACHE; a caller-supplied client
+    # gets a cache of its own so validators and snapshots don't leak across it.
+    if cache is not None:
+        return cache
+    return _DEFAULT_CACHE if client is None else LastModifiedCache()
+
+
+def _get_fetcher(client: httpx.Client | None, cache: LastModifiedCache | None) -> HttpFetcher:
+    global _DEFAULT_FETCHER
+    if client is None and cache is None:
+        if _DEFAULT_FETCHER is None:
+            _DEFAULT_FETCHER = HttpFetcher(cache=_DEFAULT_CACHE)
+        return _DEFAULT_FETCHER
+    return HttpFetcher(client=client, cache=_resolve_cache(client, cache))
+
+
+# Fetches currently in progress, keyed by report URL plus the caller's client
+# and cache, so concurrent callers sharing those share one request instead of
+# each hitting the network.
+_INFLIGHT: Dict[Tuple[str, object, object], Future[ConditionSnapshot]] = {}
+_INFLIGHT_LOCK = threading.Lock()
+_INFLIGHT_ASYNC: Dict[
+    Tuple[asyncio.AbstractEventLoop, str, object, object], asyncio.Future[ConditionSnapshot]
+] = {}
+
+
+def _coalesced(snapshot: ConditionSnapshot, timestamp: datetime | None) -> ConditionSnapshot:
+    # Followers get their own copy, since callers fill snapshots in place, and
+    # carry their own timestamp rather than the leader's.
+    if timestamp is None:
+        return replace(snapshot)
+    return replace(snapshot, timestamp=timestamp)
+
+
+def _follower_timeout(client: httpx.Client | None) -> float | None:
+    """Bound a follower's wait by the longest the leader's request may take.
+
+    That is every connect attempt the default transport makes plus the other
+    timeout phases; ``None`` when the client leaves any phase unbounded.
+    """
+    timeout = (client or get_shared_client()).timeout
+    phases = (timeout.connect, timeout.read, timeout.write, timeout.pool)
+    if any(phase is None for phase in phases):
+        return None
+    return timeout.connect * DEFAULT_RETRIES + sum(phases)
+
+
+# Async fetches hand parsing (and the cache write-through) to these threads so
+# a page being parsed never stalls the event loop. Threads start on first use.
+_PARSE_POOL = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="snow-day-parse")
 
 
 def fetch_conditions(
@@ -177,40 +294,133 @@ def fetch_conditions(
     client: httpx.Client | None = None,
     cache: LastModifiedCache | None = None,
     trace_id: str | None = None,
+    timestamp: datetime | None = None,
 ) -> ConditionSnapshot:
     trace_id = trace_id or uuid.uuid4().hex
-    if resort_id not in SCRAPERS:
-        logger.error("scrape.unknown_resort", trace_id=trace_id, resort_id=resort_id)
-        raise KeyError(f"Unknown resort_id: {resort_id}")
+    url, parser = _lookup_scraper(resort_id, trace_id)
+
+    key = (url, client, cache)
+    with _INFLIGHT_LOCK:
+        pending = _INFLIGHT.get(key)
+        if pending is None:
+            future: Future[ConditionSnapshot] = Future()
+            _INFLIGHT[key] = future
+    if pending is not None:
+        logger.info("scrape.coalesced", trace_id=trace_id, resort_id=resort_id, url=url)
+        return _coalesced(pending.result(timeout=_follower_timeout(client)), timestamp)
 
-    url, parser = SCRAPERS[resort_id]
-    fetcher = HttpFetcher(client=client, cache=cache)
+    try:
+        snapshot = _fetch_and_parse(resort_id, url, parser, client, cache, trace_id, timestamp)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(snapshot)
+        return snapshot
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[key]
+
+
+def _fetch_and_parse(
+    resort_id: str,
+    url: str,
+    parser: Parser,
+    client: httpx.Client | None,
+    cache: LastModifiedCache | None,
+    trace_id: str,
+    timestamp: datetime | None = None,
+) -> ConditionSnapshot:
+    fetcher = _get_fetcher(client, cache)
     logger.info("scrape.request", trace_id=trace_id, resort_id=resort_id, url=url)
     try:
         response = fetcher.fetch(url, trace_id=trace_id)
-        cached_snapshot = fetcher.cache.get_snapshot(url)
-        if response.status_code == 304:
-            if cached_snapshot:
-                logger.info(
-                    "scrape.cache_hit",
-                    trace_id=trace_id,
-                    resort_id=resort_id,
-                    url=url,
-                )
-                return cached_snapshot
-            raise RuntimeError("Received 304 but no cached snapshot is available")
-
-        response.raise_for_status()
-        snapshot = parser(response.text)
-        fetcher.cache.update(url, response.headers.get("Last-Modified"), snapshot)
-        logger.info(
-            "scrape.success",
+        return _snapshot_from_response(resort_id, url, parser, response, fetcher.cache, trace_id, timestamp)
+    except Exception as exc:
+        logger.error(
+            "scrape.failure",
             trace_id=trace_id,
             resort_id=resort_id,
             url=url,
-            status_code=response.status_code,
+            error=str(exc),
         )
+        raise
+
+
+async def fetch_conditions_async(
+    resort_id: str,
+    *,
+    client: httpx.AsyncClient | None = None,
+    cache: LastModifiedCache | None = None,
+    trace_id: str | None = None,
+    timestamp: datetime | None = None,
+) -> ConditionSnapshot:
+    """Async counterpart of :func:`fetch_conditions` for concurrent refreshes."""
+    trace_id = trace_id or uuid.uuid4().hex
+    url, parser = _lookup_scraper(resort_id, trace_id)
+
+    loop = asyncio.get_running_loop()
+    key = (loop, url, client, cache)
+    while (pending := _INFLIGHT_ASYNC.get(key)) is not None:
+        logger.info("scrape.coalesced", trace_id=trace_id, resort_id=resort_id, url=url)
+        try:
+            snapshot = await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            task = asyncio.current_task()
+            if not pending.cancelled() or (task is not None and task.cancelling()):
+                raise
+            # Only the leader was cancelled; fetch again, possibly as the new leader.
+            continue
+        return _coalesced(snapshot, timestamp)
+
+    future: asyncio.Future[ConditionSnapshot] = loop.create_future()
+    _INFLIGHT_ASYNC[key] = future
+    try:
+        snapshot = await _fetch_and_parse_async(resort_id, url, parser, client, cache, trace_id, timestamp)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as exc:
+        future.set_exception(exc)
+        # The exception is re-raised to this caller; don't log it as unretrieved
+        # when no one else was waiting on the shared future.
+        future.exception()
+        raise
+    else:
+        future.set_result(snapshot)
         return snapshot
+    finally:
+        del _INFLIGHT_ASYNC[key]
+
+
+async def _fetch_and_parse_async(
+    resort_id: str,
+    url: str,
+    parser: Parser,
+    client: httpx.AsyncClient | None,
+    cache: LastModifiedCache | None,
+    trace_id: str,
+    timestamp: datetime | None = None,
+) -> ConditionSnapshot:
+    fetcher = AsyncHttpFetcher(client=client, cache=_resolve_cache(client, cache))
+    logger.info("scrape.request", trace_id=trace_id, resort_id=resort_id, url=url)
+    try:
+        response = await fetcher.fetch(url, trace_id=trace_id)
+        # Run in a copy of the current context so bound structlog contextvars
+        # still reach the scrape.* events logged from the worker.
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            _PARSE_POOL,
+            context.run,
+            _snapshot_from_response,
+            resort_id,
+            url,
+            parser,
+            response,
+            fetcher.cache,
+            trace_id,
+            timestamp,
+        )
     except Exception as exc:
         logger.error(
             "scrape.failure",
@@ -220,3 +430,28 @@ def fetch_conditions(
             error=str(exc),
         )
         raise
+
+
+async def fetch_all(
+    resort_ids: Iterable[str] | None = None,
+    *,
+    client: httpx.AsyncClient | None = None,
+    cache: LastModifiedCache | None = None,
+    concurrency: int = 8,
+) -> Dict[str, ConditionSnapshot | BaseException]:
+    """Fetch several resorts concurrently, defaulting to every configured scraper.
+
+    Each value is either the resort's snapshot or the exception its fetch
+    raised, so one failing site does not discard the others. Snapshots parsed
+    in the batch share one timestamp.
+    """
+    resort_ids = list(get_scrapers() if resort_ids is None else resort_ids)
+    sem = asyncio.Semaphore(concurrency)
+    timestamp = datetime.now(timezone.utc)
+
+    async def fetch_one(resort_id: str) -> ConditionSnapshot:
+        async with sem:
+            return await fetch_conditions_async(resort_id, client=client, cache=cache, timestamp=timestamp)
+
+    results = await asyncio.gather(*(fetch_one(resort_id) for resort_id in resort_ids), return_exceptions=True)
+    return dict(zip(resort_ids, results))
@@ -1,10 +1,46 @@
-"""Base utilities for ski resort scrapers using BeautifulSoup."""
+"""Base utilities for ski resort scrapers (BeautifulSoup, lxml and selectolax)."""
 from __future__ import annotations
 
+import hashlib
 import re
-from typing import Optional, Tuple
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 from bs4 import BeautifulSoup, Tag
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
+
+
+_UTC = timezone.utc
+
+
+def utc_now() -> datetime:
+    """Default timestamp for snapshots parsed without one."""
+    return datetime.now(_UTC)
+
+
+def as_text(html: str | bytes) -> str:
+    """Decode a UTF-8 response body for parsers that work on text."""
+    if isinstance(html, bytes):
+        return html.decode("utf-8", "replace")
+    return html
+
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def html_to_text(html: str) -> str:
+    """Replace tags with spaces and collapse whitespace, for regex-driven scrapers.
+
+    Comments need no pass of their own: ``<[^>]+>`` already consumes every
+    ``<!--`` up to the next ``>``, so no complete comment survives it.
+    """
+    return _WHITESPACE_RE.sub(" ", _TAG_RE.sub(" ", html))
 
 
 def create_soup(html: str) -> BeautifulSoup:
@@ -12,14 +48,82 @@ def create_soup(html: str) -> BeautifulSoup:
     return BeautifulSoup(html, "lxml")
 
 
+def html_strings(html: str | bytes) -> List[str]:
+    """Return the page's text nodes in document order, as BeautifulSoup sees them.
+
+    Builds the lxml tree directly instead of going through BeautifulSoup's
+    per-element Python objects. Like ``soup.get_text()``, the contents of
+    ``<script>``, ``<style>`` and ``<template>`` and comments are left out.
+    """
+    data = html if isinstance(html, bytes) else html.encode("utf-8")
+    # A fresh parser per call: lxml parsers must not be shared between threads.
+    parser = etree.HTMLParser(encoding="utf-8", remove_comments=True, remove_pis=True)
+    root = etree.fromstring(data, parser)
+    if root is None:
+        return []
+    etree.strip_elements(root, "script", "style", "template", with_tail=False)
+    return list(root.itertext())
+
+
+def create_tree(html: str | bytes) -> LexborHTMLParser:
+    """Parse HTML with selectolax's lexbor backend for fast CSS selection.
+
+    Bytes are parsed as UTF-8 without an intermediate ``str``.
+    """
+    return LexborHTMLParser(html)
+
+
+_MERGED_SELECTORS: Dict[int, Tuple[Mapping[str, str], Mapping[str, str], Mapping[str, str]]] = {}
+_MERGED_SELECTORS_MAX = 64
+
+
+def merge_selectors(defaults: Mapping[str, str], selectors: Optional[Mapping[str, str]]) -> Mapping[str, str]:
+    """Overlay ``selectors`` on a parser's default selectors.
+
+    The scraper registry binds one read-only mapping per resort for the life of
+    the process, so those merges are memoized by identity. Each entry keeps
+    its key objects alive, so an ``id`` cannot be recycled while cached.
+    Plain dicts may be mutated by the caller and are merged fresh every time.
+    """
+    if not selectors:
+        return defaults
+    if not isinstance(selectors, MappingProxyType):
+        return {**defaults, **selectors}
+    entry = _MERGED_SELECTORS.get(id(selectors))
+    if entry is not None and entry[0] is defaults and entry[1] is selectors:
+        return entry[2]
+    merged = MappingProxyType({**defaults, **selectors})
+    if len(_MERGED_SELECTORS) >= _MERGED_SELECTORS_MAX:
+        _MERGED_SELECTORS.clear()
+    _MERGED_SELECTORS[id(selectors)] = (defaults, selectors, merged)
+    return merged
+
+
+_NUMERIC_RE = re.compile(r"(-?\d+(?:\.\d+)?)")
+
+
 def extract_numeric(text: str) -> Optional[float]:
     """Extract first numeric value from text."""
     if not text:
         return None
-    match = re.search(r"(-?\d+(?:\.\d+)?)", text)
+    # Most report cells are a bare number, optionally followed by a unit
+    # ("12.5", "12.5 in"); convert those directly and only fall back to the
+    # regex when the leading token isn't exactly what the pattern would match.
+    head = text.split(None, 1)
+    if head:
+        token = head[0]
+        digits = token[1:] if token[0] == "-" else token
+        if digits[:1].isdecimal() and digits[-1:].isdecimal() and digits.replace(".", "", 1).isdecimal():
+            return float(token)
+    match = _NUMERIC_RE.search(text)
     return float(match.group(1)) if match else None
 
 
+_WIND_DIR_FIRST_RE = re.compile(r"([NSEW/]{1,4})[,]?\s*(\d+)(?:\s*-\s*(\d+))?\s*mph", re.IGNORECASE)
+_WIND_MPH_FIRST_RE = re.compile(r"(\d+)(?:\s*-\s*(\d+))?\s*mph\s*([NSEW]{1,2})", re.IGNORECASE)
+_WIND_PLAIN_RE = re.compile(r"(\d+)(?:\s*-\s*(\d+))?\s*mph", re.IGNORECASE)
+
+
 def parse_wind(text: str) -> Tuple[Optional[float], Optional[str]]:
     """Parse wind speed and direction from various text formats.
     
@@ -33,7 +137,7 @@ def parse_wind(text: str) -> Tuple[Optional[float], Optional[str]]:
         return None, None
     
     # Try direction first pattern: "NW, 5-12 mph"
-    match = re.search(r"([NSEW/]{1,4})[,]?\s*(\d+)(?:\s*-\s*(\d+))?\s*mph", text, re.IGNORECASE)
+    match = _WIND_DIR_FIRST_RE.search(text)
     if match:
         direction = match.group(1).upper().replace("/", "")
         low = int(match.group(2))
@@ -42,7 +146,7 @@ def parse_wind(text: str) -> Tuple[Optional[float], Optional[str]]:
         return speed, direction
     
     # Try mph then direction: "5-12 mph NW"
-    match = re.search(r"(\d+)(?:\s*-\s*(\d+))?\s*mph\s*([NSEW]{1,2})", text, re.IGNORECASE)
+    match = _WIND_MPH_FIRST_RE.search(text)
     if match:
         low = int(match.group(1))
         high = int(match.group(2)) if match.group(2) else low
@@ -51,7 +155,7 @@ def parse_wind(text: str) -> Tuple[Optional[float], Optional[str]]:
         return speed, direction
     
     # Try just mph without direction: "5-12 mph"
-    match = re.search(r"(\d+)(?:\s*-\s*(\d+))?\s*mph", text, re.IGNORECASE)
+    match = _WIND_PLAIN_RE.search(text)
     if match:
         low = int(match.group(1))
         high = int(match.group(2)) if match.group(2) else low
@@ -61,6 +165,11 @@ def parse_wind(text: str) -> Tuple[Optional[float], Optional[str]]:
     return None, None
 
 
+_TEMP_LOW_RE = re.compile(r"LOW\s*:?\s*(-?\d+)", re.IGNORECASE)
+_TEMP_HIGH_RE = re.compile(r"HIGH\s*:?\s*(-?\d+)", re.IGNORECASE)
+_TEMP_DEG_RE = re.compile(r"(-?\d+)\s*[°ºF]")
+
+
 def parse_temperature(text: str) -> Tuple[Optional[float], Optional[float]]:
     """Parse low and high temperatures from text.
     
@@ -73,8 +182,8 @@ def parse_temperature(text: str) -> Tuple[Optional[float], Optional[float]]:
     temp_high = None
     
     # Try "LOW XX" and "HIGH XX" patterns
-    low_match = re.search(r"LOW\s*:?\s*(-?\d+)", text, re.IGNORECASE)
-    high_match = re.search(r"HIGH\s*:?\s*(-?\d+)", text, re.IGNORECASE)
+    low_match = _TEMP_LOW_RE.search(text)
+    high_match = _TEMP_HIGH_RE.search(text)
     
     if low_match:
         temp_low = float(low_match.group(1))
@@ -83,16 +192,25 @@ def parse_temperature(text: str) -> Tuple[Optional[float], Optional[float]]:
     
     # If not found, try finding degree patterns
     if temp_low is None or temp_high is None:
-        temps = re.findall(r"(-?\d+)\s*[°ºF]", text)
-        if len(temps) >= 2:
-            temp_values = [float(t) for t in temps]
+        # Track min/max while scanning instead of collecting every match.
+        count = 0
+        lowest = highest = 0.0
+        for match in _TEMP_DEG_RE.finditer(text):
+            value = float(match.group(1))
+            if count == 0 or value < lowest:
+                lowest = value
+            if count == 0 or value > highest:
+                highest = value
+            count += 1
+        if count >= 2:
             if temp_low is None:
-                temp_low = min(temp_values)
+                temp_low = lowest
             if temp_high is None:
-                temp_high = max(temp_values)
-        elif len(temps) == 1:
+                temp_high = highest
+        elif count == 1:
+            # A lone reading is treated as the high.
             if temp_high is None:
-                temp_high = float(temps[0])
+                temp_high = highest
     
     return temp_low, temp_high
 
@@ -121,34 +239,40 @@ def find_text_by_label(soup: BeautifulSoup, label: str, search_scope: Tag = None
     return None
 
 
-def find_surface_condition(soup: BeautifulSoup) -> Optional[str]:
+_SURFACE_PATTERNS = (
+    "Machine Groomed",
+    "Packed Powder",
+    "Loose Granular",
+    "Powder",
+    "Hardpack",
+    "Frozen Granular",
+    "Variable",
+    "Spring Conditions",
+    "Ice",
+)
+_SURFACE_NEEDLES = tuple((pattern, pattern.lower()) for pattern in _SURFACE_PATTERNS)
+
+
+def find_surface_condition(full_text: str) -> Optional[str]:
     """Find snow surface condition from page text."""
-    full_text = soup.get_text()
-    surface_patterns = [
-        "Machine Groomed",
-        "Packed Powder", 
-        "Loose Granular",
-        "Powder",
-        "Hardpack",
-        "Frozen Granular",
-        "Variable",
-        "Spring Conditions",
-        "Ice",
-    ]
-    
-    for pattern in surface_patterns:
-        if pattern.lower() in full_text.lower():
+    # Lowercase the page once; substring search beats a regex alternation here.
+    lowered = full_text.lower()
+    for pattern, needle in _SURFACE_NEEDLES:
+        if needle in lowered:
             return pattern
-    
+
     return None
 
 
+_LIFTS_FRAC_RE = re.compile(r"(\d+)\s*(?:of|/)\s*(\d+)")
+
+
 def parse_lifts_fraction(text: str) -> Tuple[Optional[int], Optional[int]]:
     """Parse lift status like '5 of 12' or '5/12' into (open, total)."""
     if not text:
         return None, None
     
-    match = re.search(r"(\d+)\s*(?:of|/)\s*(\d+)", text)
+    match = _LIFTS_FRAC_RE.search(text)
     if match:
         return int(match.group(1)), int(match.group(2))
     
@@ -160,10 +284,13 @@ def parse_lifts_fraction(text: str) -> Tuple[Optional[int], Optional[int]]:
     return None, None
 
 
+_STATUS_RE = re.compile(r"status\s*:?\s*(open|closed)")
+
+
 def _detect_onthesnow_status(text: str) -> Optional[bool]:
     """Infer whether a resort is operating based on common OnTheSnow phrases."""
     lowered = text.lower()
-    status_match = re.search(r"status\s*:?\s*(open|closed)", lowered)
+    status_match = _STATUS_RE.search(lowered)
     if status_match:
         return status_match.group(1) == "open"
 
@@ -179,66 +306,118 @@ def _detect_onthesnow_status(text: str) -> Optional[bool]:
     return None
 
 
-def _extract_open_counts(text: str, keywords: Tuple[str, ...]) -> Tuple[Optional[int], Optional[int]]:
-    """Extract open/total counts for lifts or trails."""
+@lru_cache(maxsize=None)
+def _open_count_patterns(keywords: Tuple[str, ...]) -> Tuple[Tuple[re.Pattern[str], ...], ...]:
+    """Compile the "N of M" patterns for each keyword, once per keyword tuple.
+
+    The patterns are case-sensitive and run against casefolded text: without
+    IGNORECASE, ``re`` can skip ahead to each keyword's literal prefix instead
+    of trying the pattern at every position, which is several times faster
+    than one case-insensitive search (or one fused alternation) over a page.
+    """
+    return (
+        tuple(re.compile(rf"{keyword}\s*(\d+)\s*(?:of|/)\s*(\d+)") for keyword in keywords),
+        tuple(re.compile(rf"(\d+)\s*(?:of|/)\s*(\d+)\s*{keyword}") for keyword in keywords),
+        tuple(re.compile(rf"{keyword}\s*(\d+)") for keyword in keywords),
+    )
 
-    def _pattern(keyword: str) -> str:
-        return rf"{keyword}\s*(\d+)\s*(?:of|/)\s*(\d+)"
 
-    for keyword in keywords:
-        match = re.search(_pattern(keyword), text, re.IGNORECASE)
+def _extract_open_counts(folded_text: str, keywords: Tuple[str, ...]) -> Tuple[Optional[int], Optional[int]]:
+    """Extract open/total counts for lifts or trails.
+
+    ``folded_text`` must already be casefolded and ``keywords`` lowercase, so
+    one fold of the page serves every lookup.
+    """
+    forward, reversed_, single = _open_count_patterns(keywords)
+
+    for pattern in forward:
+        match = pattern.search(folded_text)
         if match:
             return int(match.group(1)), int(match.group(2))
 
     # Handle reversed order: "5 of 12 lifts open"
-    for keyword in keywords:
-        match = re.search(rf"(\d+)\s*(?:of|/)\s*(\d+)\s*{keyword}", text, re.IGNORECASE)
+    for pattern in reversed_:
+        match = pattern.search(folded_text)
         if match:
             return int(match.group(1)), int(match.group(2))
 
     # Handle single value "Lifts Open 5"
-    for keyword in keywords:
-        match = re.search(rf"{keyword}\s*(\d+)", text, re.IGNORECASE)
+    for pattern in single:
+        match = pattern.search(folded_text)
         if match:
             return int(match.group(1)), None
 
     return None, None
 
 
-def parse_onthesnow(html: str) -> dict:
+_BASE_DEPTH_RE = re.compile(r'Base\s*(\d+)["\u2033″]')
+_SNOW_24H_RE = re.compile(r'24h\s*(\d+)["\u2033″]')
+_SURFACE_AFTER_BASE_RE = re.compile(r'Base\s*\d+["\u2033″]\s*([A-Za-z]+(?:\s+[A-Za-z]+)?)\s*Conditions')
+
+
+# Parsed OnTheSnow metrics keyed by a digest of the page, so identical pages
+# (the same shared error page for several resorts, re-fed fixtures) parse once.
+_ONTHESNOW_CACHE: "OrderedDict[bytes, Mapping[str, object]]" = OrderedDict()
+_ONTHESNOW_CACHE_LOCK = threading.Lock()
+_ONTHESNOW_CACHE_SIZE = 64
+
+
+def parse_onthesnow(html: str | bytes) -> dict:
     """Parse OnTheSnow.com ski report HTML into a metrics dictionary.
     
     OnTheSnow provides standardized ski condition data for many resorts.
     Returns a dict with raw metrics ready for the normalizer.
+
+    Results are memoized by page digest. Only these timestamp-free metrics are
+    cached, read-only, and every call gets its own dict, so each caller still
+    builds and stamps a fresh snapshot.
     """
-    soup = create_soup(html)
-    text = soup.get_text(' ', strip=True)
+    data = html if isinstance(html, bytes) else html.encode("utf-8")
+    key = hashlib.blake2b(data, digest_size=16).digest()
+    with _ONTHESNOW_CACHE_LOCK:
+        cached = _ONTHESNOW_CACHE.get(key)
+        if cached is not None:
+            _ONTHESNOW_CACHE.move_to_end(key)
+            return dict(cached)
+
+    metrics = _parse_onthesnow(data)
+    with _ONTHESNOW_CACHE_LOCK:
+        _ONTHESNOW_CACHE[key] = MappingProxyType(metrics)
+        while len(_ONTHESNOW_CACHE) > _ONTHESNOW_CACHE_SIZE:
+            _ONTHESNOW_CACHE.popitem(last=False)
+    return dict(metrics)
+
+
+def _parse_onthesnow(html: bytes) -> dict:
+    strings = html_strings(html)
+    text = " ".join(stripped for stripped in (string.strip() for string in strings) if stripped)
     
     base_depth = None
     snowfall_24h = None
     precip_type = None
     
     # Extract base depth: "Base 10" Variable Conditions"
-    base_match = re.search(r'Base\s*(\d+)["\u2033″]', text)
+    base_match = _BASE_DEPTH_RE.search(text)
     if base_match:
         base_depth = float(base_match.group(1))
     
     # Extract 24h snowfall from the recent snowfall row
     # Pattern: "24h 0"" or individual day amounts
-    snow_24h_match = re.search(r'24h\s*(\d+)["\u2033″]', text)
+    snow_24h_match = _SNOW_24H_RE.search(text)
     if snow_24h_match:
         snowfall_24h = float(snow_24h_match.group(1))
     
     # Extract surface conditions - look after "Base XX" for conditions
-    surface_match = re.search(r'Base\s*\d+["\u2033″]\s*([A-Za-z]+(?:\s+[A-Za-z]+)?)\s*Conditions', text)
+    surface_match = _SURFACE_AFTER_BASE_RE.search(text)
     if surface_match:
         precip_type = surface_match.group(1).strip()
     else:
         # Fallback to finding common condition keywords
-        precip_type = find_surface_condition(soup)
+        precip_type = find_surface_condition("".join(strings))
 
-    lifts_open, lifts_total = _extract_open_counts(text, ("lifts open", "open lifts", "lifts running"))
-    trails_open, trails_total = _extract_open_counts(text, ("trails open", "open trails", "runs open", "open runs"))
+    folded = text.casefold()
+    lifts_open, lifts_total = _extract_open_counts(folded, ("lifts open", "open lifts", "lifts running"))
+    trails_open, trails_total = _extract_open_counts(folded, ("trails open", "open trails", "runs open", "open runs"))
 
     # Prioritize trails/lifts data over text-based status detection
     # If we have open trails or lifts, the resort is definitely open
@@ -5,33 +5,55 @@ Source: https://www.cannonmt.com/mountain-report
 from __future__ import annotations
 
 import re
-from datetime import datetime, timezone
-from typing import Optional, Tuple
+from datetime import datetime
+from typing import Callable, Optional, Tuple
 
 from bs4 import BeautifulSoup
 
 from ..models import ConditionSnapshot
 from ..normalization import DEFAULT_NORMALIZER
+from .base import as_text, html_to_text, utc_now
 
 RESORT_ID = "cannon_mountain"
 DEFAULT_REPORT_URL = "https://www.cannonmt.com/mountain-report"
 
+_TEMP_LOW_RE = re.compile(r'LOW\s*(\d+)\s*[°ºo]', re.IGNORECASE)
+_TEMP_HIGH_RE = re.compile(r'HIGH\s*(\d+)\s*[°ºo]', re.IGNORECASE)
+_WIND_RE = re.compile(r'BASE\s*([NSEW/]+)[,\s]*(\d+)-(\d+)\s*mph', re.IGNORECASE)
+_SNOW_48H_RE = re.compile(r'(\d+)\s*["\u201d]\s*Last\s*48', re.IGNORECASE)
+_SNOWFALL_TO_DATE_RE = re.compile(r'SNOWFALL\s*TO\s*DATE[^0-9]*(\d+)', re.IGNORECASE)
+_SURFACE_RE = re.compile(r'PRIMARY\s*SURFACE\s*([A-Za-z\s]+?)(?:SECONDARY|$)', re.IGNORECASE)
 
-def _extract_count(label: str, text: str) -> Tuple[Optional[int], Optional[int]]:
-    pattern = rf"{label}\s*(\d+)\s*(?:of|/)\s*(\d+)"
-    match = re.search(pattern, text, re.IGNORECASE)
-    if match:
-        return int(match.group(1)), int(match.group(2))
 
-    match = re.search(rf"(\d+)\s*(?:of|/)\s*(\d+)\s*{label}", text, re.IGNORECASE)
-    if match:
-        return int(match.group(1)), int(match.group(2))
+CountExtractor = Callable[[str], Tuple[Optional[int], Optional[int]]]
 
-    match = re.search(rf"{label}\s*(\d+)", text, re.IGNORECASE)
-    if match:
-        return int(match.group(1)), None
 
-    return None, None
+def _make_count_extractor(label: str) -> CountExtractor:
+    """Build a counter for ``label`` with its three patterns compiled up front."""
+    forward = re.compile(rf"{label}\s*(\d+)\s*(?:of|/)\s*(\d+)", re.IGNORECASE)
+    reversed_ = re.compile(rf"(\d+)\s*(?:of|/)\s*(\d+)\s*{label}", re.IGNORECASE)
+    single = re.compile(rf"{label}\s*(\d+)", re.IGNORECASE)
+
+    def _extract(text: str) -> Tuple[Optional[int], Optional[int]]:
+        match = forward.search(text)
+        if match:
+            return int(match.group(1)), int(match.group(2))
+
+        match = reversed_.search(text)
+        if match:
+            return int(match.group(1)), int(match.group(2))
+
+        match = single.search(text)
+        if match:
+            return int(match.group(1)), None
+
+        return None, None
+
+    return _extract
+
+
+_extract_lifts = _make_count_extractor("LIFTS OPEN")
+_extract_trails = _make_count_extractor("TRAILS OPEN")
 
 
 def _detect_operational_status(text: str, trails_open: Optional[int], lifts_open: Optional[int]) -> Optional[bool]:
@@ -47,12 +69,11 @@ def _detect_operational_status(text: str, trails_open: Optional[int], lifts_open
     return None
 
 
-def parse_conditions(html: str, **kwargs) -> ConditionSnapshot:
+def parse_conditions(html: str | bytes, *, timestamp: datetime | None = None, **kwargs) -> ConditionSnapshot:
     """Parse Cannon Mountain snow report HTML into a ConditionSnapshot."""
+    html = as_text(html)
     # Strip HTML tags and clean up the text for regex matching
-    full_text = re.sub(r'<[^>]+>', ' ', html)
-    full_text = re.sub(r'<!--.*?-->', '', full_text)
-    full_text = re.sub(r'\s+', ' ', full_text)
+    full_text = html_to_text(html)
 
     # Initialize all values
     base_depth = None
@@ -68,33 +89,33 @@ def parse_conditions(html: str, **kwargs) -> ConditionSnapshot:
     trails_total = None
 
     # Find temperatures - pattern: LOW XX° and HIGH XX°
-    low_match = re.search(r'LOW\s*(\d+)\s*[°ºo]', full_text, re.IGNORECASE)
-    high_match = re.search(r'HIGH\s*(\d+)\s*[°ºo]', full_text, re.IGNORECASE)
+    low_match = _TEMP_LOW_RE.search(full_text)
+    high_match = _TEMP_HIGH_RE.search(full_text)
     if low_match:
         temp_low = float(low_match.group(1))
     if high_match:
         temp_high = float(high_match.group(1))
 
     # Find wind - pattern: BASE S/SW, 5-12 mph
-    wind_match = re.search(r'BASE\s*([NSEW/]+)[,\s]*(\d+)-(\d+)\s*mph', full_text, re.IGNORECASE)
+    wind_match = _WIND_RE.search(full_text)
     if wind_match:
         low_wind = int(wind_match.group(2))
         high_wind = int(wind_match.group(3))
         wind_speed = (low_wind + high_wind) / 2
 
     # Find snowfall - pattern: 5" Last 48 Hours
-    snow_match = re.search(r'(\d+)\s*["\u201d]\s*Last\s*48', full_text, re.IGNORECASE)
+    snow_match = _SNOW_48H_RE.search(full_text)
     if snow_match:
         snowfall_48h = float(snow_match.group(1))
         snowfall_24h = snowfall_48h / 2  # Estimate 24h as half of 48h
 
     # Find base depth - Snowfall to Date
-    depth_match = re.search(r'SNOWFALL\s*TO\s*DATE[^0-9]*(\d+)', full_text, re.IGNORECASE)
+    depth_match = _SNOWFALL_TO_DATE_RE.search(full_text)
     if depth_match:
         base_depth = float(depth_match.group(1))
 
     # Find surface conditions
-    surface_match = re.search(r'PRIMARY\s*SURFACE\s*([A-Za-z\s]+?)(?:SECONDARY|$)', full_text, re.IGNORECASE)
+    surface_match = _SURFACE_RE.search(full_text)
     if surface_match:
         precip_type = surface_match.group(1).strip()
     else:
@@ -105,8 +126,8 @@ def parse_conditions(html: str, **kwargs) -> ConditionSnapshot:
                 precip_type = condition
                 break
 
-    lifts_open, lifts_total = _extract_count("LIFTS OPEN", full_text)
-    trails_open, trails_total = _extract_count("TRAILS OPEN", full_text)
+    lifts_open, lifts_total = _extract_lifts(full_text)
+    trails_open, trails_total = _extract_trails(full_text)
     status = _detect_operational_status(full_text, trails_open, lifts_open)
 
     raw_metrics = {
@@ -129,5 +150,5 @@ def parse_conditions(html: str, **kwargs) -> ConditionSnapshot:
     return DEFAULT_NORMALIZER.normalize(
         RESORT_ID,
         raw_metrics,
-        timestamp=datetime.now(timezone.utc),
+        timestamp=timestamp or utc_now(),
     )
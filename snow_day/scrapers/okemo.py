@@ -4,22 +4,22 @@ Source: https://www.onthesnow.com/vermont/okemo-mountain-resort/skireport
 """
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
 
 from ..models import ConditionSnapshot
 from ..normalization import DEFAULT_NORMALIZER
-from .base import parse_onthesnow
+from .base import parse_onthesnow, utc_now
 
 RESORT_ID = "okemo"
 DEFAULT_REPORT_URL = "https://www.onthesnow.com/vermont/okemo-mountain-resort/skireport"
 
 
-def parse_conditions(html: str, **kwargs) -> ConditionSnapshot:
+def parse_conditions(html: str | bytes, *, timestamp: datetime | None = None, **kwargs) -> ConditionSnapshot:
     """Parse OnTheSnow Okemo snow report HTML into a ConditionSnapshot."""
     raw_metrics = parse_onthesnow(html)
 
     return DEFAULT_NORMALIZER.normalize(
         RESORT_ID,
         raw_metrics,
-        timestamp=datetime.now(timezone.utc),
+        timestamp=timestamp or utc_now(),
     )
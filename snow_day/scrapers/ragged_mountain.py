@@ -5,21 +5,30 @@ Source: https://www.raggedmountainresort.com/mountain-report-cams/
 from __future__ import annotations
 
 import re
-from datetime import datetime, timezone
+from datetime import datetime
 
 from ..models import ConditionSnapshot
 from ..normalization import DEFAULT_NORMALIZER
+from .base import as_text, html_to_text, utc_now
 
 RESORT_ID = "ragged_mountain"
 DEFAULT_REPORT_URL = "https://www.raggedmountainresort.com/mountain-report-cams/"
 
+_SNOW_24H_RE = re.compile(r'Last 24 hrs\.\s*(\d+(?:\.\d+)?)\s*["\u201d]', re.IGNORECASE)
+_SNOW_48H_RE = re.compile(r'Last 48 hrs\.\s*(\d+(?:\.\d+)?)\s*["\u201d]', re.IGNORECASE)
+_BASE_RE = re.compile(r'Current Base\s*(\d+(?:\.\d+)?)\s*["\u201d]', re.IGNORECASE)
+_TEMP_HL_RE = re.compile(r"(?P<which>[HL]):\s*(?:<[^>]+>)?\s*(\d+(?:\.\d+)?)\s*°\s*F", re.IGNORECASE)
+_TEMP_HIGH_HTML_RE = re.compile(r'H:\s*<span[^>]*>\s*(\d+(?:\.\d+)?)\s*°\s*F', re.IGNORECASE)
+_TEMP_LOW_HTML_RE = re.compile(r'L:\s*<span[^>]*>\s*(\d+(?:\.\d+)?)\s*°\s*F', re.IGNORECASE)
+_WIND_RE = re.compile(r"Wind\s*(?:<[^>]+>)?\s*(\d+(?:\.\d+)?)\s*mph", re.IGNORECASE)
+_WIND_HTML_RE = re.compile(r'Wind\s*<span[^>]*>\s*(\d+(?:\.\d+)?)\s*mph', re.IGNORECASE)
 
-def parse_conditions(html: str, **kwargs) -> ConditionSnapshot:
+
+def parse_conditions(html: str | bytes, *, timestamp: datetime | None = None, **kwargs) -> ConditionSnapshot:
     """Parse Ragged Mountain snow report HTML into a ConditionSnapshot."""
+    html = as_text(html)
     # Strip HTML tags and clean up the text for regex matching
-    full_text = re.sub(r'<[^>]+>', ' ', html)
-    full_text = re.sub(r'<!--.*?-->', '', full_text)
-    full_text = re.sub(r'\s+', ' ', full_text)
+    full_text = html_to_text(html)
 
     # Initialize all values
     base_depth = None
@@ -32,48 +41,50 @@ def parse_conditions(html: str, **kwargs) -> ConditionSnapshot:
 
     # Extract snowfall - Ragged uses format: <h6>Last 24 hrs.</h6> <h3>1"</h3>
     # Pattern: Last 24 hrs. ... number"
-    snow_24h_match = re.search(r'Last 24 hrs\.\s*(\d+(?:\.\d+)?)\s*["\u201d]', full_text, re.IGNORECASE)
+    snow_24h_match = _SNOW_24H_RE.search(full_text)
     if snow_24h_match:
         snowfall_24h = float(snow_24h_match.group(1))
 
     # Extract 48hr snowfall
-    snow_48h_match = re.search(r'Last 48 hrs\.\s*(\d+(?:\.\d+)?)\s*["\u201d]', full_text, re.IGNORECASE)
+    snow_48h_match = _SNOW_48H_RE.search(full_text)
     if snow_48h_match:
         snowfall_48h = float(snow_48h_match.group(1))
 
     # Extract Current Base
-    base_match = re.search(r'Current Base\s*(\d+(?:\.\d+)?)\s*["\u201d]', full_text, re.IGNORECASE)
+    base_match = _BASE_RE.search(full_text)
     if base_match:
         base_depth = float(base_match.group(1))
 
     # Extract temperature - format: 23.4° F or H: 23.6° F or L: 19.4° F
-    temp_high_match = re.search(r"H:\s*(?:<[^>]+>)?\s*(\d+(?:\.\d+)?)\s*°\s*F", full_text, re.IGNORECASE)
-    if temp_high_match:
-        temp_high = float(temp_high_match.group(1))
-    
-    temp_low_match = re.search(r"L:\s*(?:<[^>]+>)?\s*(\d+(?:\.\d+)?)\s*°\s*F", full_text, re.IGNORECASE)
-    if temp_low_match:
-        temp_low = float(temp_low_match.group(1))
+    # One sweep picks up the first H: and the first L: reading
+    for temp_match in _TEMP_HL_RE.finditer(full_text):
+        if temp_match.group("which") in "Hh":
+            if temp_high is None:
+                temp_high = float(temp_match.group(2))
+        elif temp_low is None:
+            temp_low = float(temp_match.group(2))
+        if temp_high is not None and temp_low is not None:
+            break
 
     # Also try to get temps from the original HTML structure: <span>H: <span class="temprature">23.6° F</span></span>
     if temp_high is None:
-        temp_high_html_match = re.search(r'H:\s*<span[^>]*>\s*(\d+(?:\.\d+)?)\s*°\s*F', html, re.IGNORECASE)
+        temp_high_html_match = _TEMP_HIGH_HTML_RE.search(html)
         if temp_high_html_match:
             temp_high = float(temp_high_html_match.group(1))
     
     if temp_low is None:
-        temp_low_html_match = re.search(r'L:\s*<span[^>]*>\s*(\d+(?:\.\d+)?)\s*°\s*F', html, re.IGNORECASE)
+        temp_low_html_match = _TEMP_LOW_HTML_RE.search(html)
         if temp_low_html_match:
             temp_low = float(temp_low_html_match.group(1))
 
     # Extract wind speed - format: Wind 0.3 mph or Wind <span class="content">0.3 mph</span>
-    wind_match = re.search(r"Wind\s*(?:<[^>]+>)?\s*(\d+(?:\.\d+)?)\s*mph", full_text, re.IGNORECASE)
+    wind_match = _WIND_RE.search(full_text)
     if wind_match:
         wind_speed = float(wind_match.group(1))
     
     # Also try from original HTML
     if wind_speed is None:
-        wind_html_match = re.search(r'Wind\s*<span[^>]*>\s*(\d+(?:\.\d+)?)\s*mph', html, re.IGNORECASE)
+        wind_html_match = _WIND_HTML_RE.search(html)
         if wind_html_match:
             wind_speed = float(wind_html_match.group(1))
 
@@ -92,5 +103,5 @@ def parse_conditions(html: str, **kwargs) -> ConditionSnapshot:
     return DEFAULT_NORMALIZER.normalize(
         RESORT_ID,
         raw_metrics,
-        timestamp=datetime.now(timezone.utc),
+        timestamp=timestamp or utc_now(),
     )
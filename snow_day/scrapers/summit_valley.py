@@ -5,18 +5,18 @@ This is a configurable scraper that uses CSS selectors defined in config.
 from __future__ import annotations
 
 import re
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Dict, Mapping, MutableMapping, Optional
 
-from bs4 import BeautifulSoup
-
 from ..models import ConditionSnapshot
 from ..normalization import DEFAULT_NORMALIZER
-from .base import create_soup, extract_numeric
+from .base import create_tree, extract_numeric, merge_selectors, utc_now
 
 RESORT_ID = "summit_valley"
 DEFAULT_REPORT_URL = "https://example.com/summit-valley/conditions"
 
+_WIND_RE = re.compile(r"(?P<direction>[A-Z]{1,3})\s+at\s+(?P<speed>\d+(?:\.\d+)?)", re.IGNORECASE)
+
 DEFAULT_SELECTORS: MutableMapping[str, str] = {
     "wind": ".conditions .wind",
     "base": ".conditions .base",
@@ -37,59 +37,85 @@ def _extract_float(text: str) -> Optional[float]:
     return extract_numeric(text)
 
 
-def parse_conditions(html: str, *, selectors: Mapping[str, str] | None = None) -> ConditionSnapshot:
+def parse_conditions(
+    html: str | bytes,
+    *,
+    selectors: Mapping[str, str] | None = None,
+    timestamp: datetime | None = None,
+) -> ConditionSnapshot:
     """Parse snow report HTML using configurable selectors."""
-    active_selectors: Dict[str, str] = {**DEFAULT_SELECTORS, **(selectors or {})}
-    soup = create_soup(html)
+    active_selectors = merge_selectors(DEFAULT_SELECTORS, selectors)
+    tree = create_tree(html)
 
     wind_speed = None
-    wind_direction = None
     wind_selector = active_selectors.get("wind")
     if wind_selector:
-        wind_node = soup.select_one(wind_selector)
+        wind_node = tree.css_first(wind_selector)
         if wind_node:
-            wind_text = wind_node.get_text()
-            match = re.search(r"(?P<direction>[A-Z]{1,3})\s+at\s+(?P<speed>\d+(?:\.\d+)?)", wind_text, re.IGNORECASE)
+            wind_text = wind_node.text()
+            match = _WIND_RE.search(wind_text)
             if match:
                 wind_speed = float(match.group("speed"))
-                wind_direction = match.group("direction")
 
     base_depth = None
     base_selector = active_selectors.get("base")
     if base_selector:
-        base_node = soup.select_one(base_selector)
+        base_node = tree.css_first(base_selector)
         if base_node:
-            base_depth = _extract_float(base_node.get_text())
+            base_depth = _extract_float(base_node.text())
 
     snowfall: Dict[str, Optional[float]] = {"12h": None, "24h": None, "7d": None}
     
-    snowfall_12h_node = soup.select_one(active_selectors.get("snowfall_12h", ""))
-    snowfall_24h_node = soup.select_one(active_selectors.get("snowfall_24h", ""))
-    snowfall_7d_node = soup.select_one(active_selectors.get("snowfall_7d", ""))
+    snowfall_12h_node = tree.css_first(active_selectors.get("snowfall_12h", ""))
+    snowfall_24h_node = tree.css_first(active_selectors.get("snowfall_24h", ""))
+    snowfall_7d_node = tree.css_first(active_selectors.get("snowfall_7d", ""))
     
     if snowfall_12h_node:
-        snowfall["12h"] = _extract_float(snowfall_12h_node.get_text())
+        snowfall["12h"] = _extract_float(snowfall_12h_node.text())
     if snowfall_24h_node:
-        snowfall["24h"] = _extract_float(snowfall_24h_node.get_text())
+        snowfall["24h"] = _extract_float(snowfall_24h_node.text())
     if snowfall_7d_node:
-        snowfall["7d"] = _extract_float(snowfall_7d_node.get_text())
+        snowfall["7d"] = _extract_float(snowfall_7d_node.text())
 
-    temps: Dict[str, Optional[float]] = {"low": None, "high": None}
+    temp_low = None
+    temp_high = None
     temps_selector = active_selectors.get("temps_table")
     if temps_selector:
-        for row in soup.select(temps_selector):
-            th = row.select_one("th")
-            td = row.select_one("td")
-            if th and td:
-                key = th.get_text(strip=True).lower()
-                temps[key] = _extract_float(td.get_text())
+        # The last low/high row wins, so walk backwards and stop once both are seen
+        pending = {"low", "high"}
+        for row in reversed(tree.css(temps_selector)):
+            th = row.css_first("th")
+            if not th:
+                continue
+            key = th.text(strip=True).lower()
+            if key not in pending:
+                continue
+            td = row.css_first("td")
+            if not td:
+                continue
+            pending.discard(key)
+            if key == "low":
+                temp_low = _extract_float(td.text())
+            else:
+                temp_high = _extract_float(td.text())
+            if not pending:
+                break
 
     lift_status: Dict[str, str] = {}
     lifts_selector = active_selectors.get("lifts_table")
     if lifts_selector:
-        for row in soup.select(lifts_selector):
-            name = row.get(active_selectors.get("lift_name_attr", ""), row.get_text(strip=True))
-            status = row.get(active_selectors.get("lift_status_attr", ""), row.get_text(strip=True))
+        name_attr = active_selectors.get("lift_name_attr", "")
+        status_attr = active_selectors.get("lift_status_attr", "")
+        for row in tree.css(lifts_selector):
+            attributes = row.attributes
+            if name_attr in attributes and status_attr in attributes:
+                name = attributes[name_attr]
+                status = attributes[status_attr]
+            else:
+                # Only walk the row's text when an attribute is missing
+                row_text = row.text(strip=True)
+                name = attributes.get(name_attr, row_text)
+                status = attributes.get(status_attr, row_text)
             if name:
                 lift_status[name] = status.lower() if status else ""
 
@@ -99,8 +125,8 @@ def parse_conditions(html: str, *, selectors: Mapping[str, str] | None = None) -
     raw_metrics = {
         "wind_speed_mph": wind_speed,
         "wind_chill_f": None,
-        "temp_low_f": temps.get("low"),
-        "temp_high_f": temps.get("high"),
+        "temp_low_f": temp_low,
+        "temp_high_f": temp_high,
         "snowfall_last_12h_in": snowfall["12h"],
         "snowfall_last_24h_in": snowfall["24h"],
         "snowfall_last_7d_in": snowfall["7d"],
@@ -109,6 +135,6 @@ def parse_conditions(html: str, *, selectors: Mapping[str, str] | None = None) -
     }
 
     snapshot = DEFAULT_NORMALIZER.normalize(
-        RESORT_ID, raw_metrics, timestamp=datetime.now(timezone.utc)
+        RESORT_ID, raw_metrics, timestamp=timestamp or utc_now()
     )
     return snapshot
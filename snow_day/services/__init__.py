@@ -1,5 +1,19 @@
 """Service layer utilities for snow day calculations."""
 
-from .llm_client import LLMClient, RuleBasedAdvisor, ScoredResort
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .llm_client import LLMClient, RuleBasedAdvisor, ScoredResort
 
 __all__ = ["LLMClient", "RuleBasedAdvisor", "ScoredResort"]
+
+
+def __getattr__(name: str):
+    # Importing a sibling such as services.scoring shouldn't pull in the LLM client.
+    if name in __all__:
+        from . import llm_client
+
+        return getattr(llm_client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,32 @@
 from __future__ import annotations
 
+import heapq
 import os
 import textwrap
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional, Sequence
+from operator import attrgetter
+from typing import List, Optional, Sequence, Tuple
 
 import httpx
+import orjson
 
 from snow_day.services.scoring import ScoreResult
 
+_BY_SCORE = attrgetter("score")
+
+# Summary and recommendation calls hit the same local server back to back, so
+# keep a few connections warm between requests instead of reconnecting.
+LLM_LIMITS = httpx.Limits(max_keepalive_connections=8, max_connections=16, keepalive_expiry=60)
+
+# Prompts only change when scores do, so identical prompts reuse the last
+# generation instead of waiting seconds on the model again. Entries expire so a
+# long-lived client still asks the model again now and then.
+_RESPONSE_CACHE_SIZE = 128
+DEFAULT_RESPONSE_TTL = 3600.0
+
 
 @dataclass
 class ScoredResort:
@@ -80,8 +98,7 @@ class RuleBasedAdvisor:
         if not resorts:
             return "No resort scores are available to summarize yet."
 
-        sorted_resorts = sorted(resorts, key=lambda resort: resort.score, reverse=True)
-        picks = sorted_resorts[:top_n]
+        picks = heapq.nlargest(top_n, resorts, key=_BY_SCORE)
         
         # Build concise, review-style recommendations
         lines = []
@@ -112,9 +129,9 @@ class RuleBasedAdvisor:
         if not resorts:
             return "No resort data is available to recommend a destination today."
 
-        sorted_resorts = sorted(resorts, key=lambda resort: resort.score, reverse=True)
-        best = sorted_resorts[0]
-        alternates = sorted_resorts[1:3]
+        ranked = heapq.nlargest(3, resorts, key=_BY_SCORE)
+        best = ranked[0]
+        alternates = ranked[1:3]
 
         # Build concise recommendation
         highlights = []
@@ -150,33 +167,75 @@ class LLMClient:
         timeout: float = 30.0,  # Increased timeout for LLM generation
         client: Optional[httpx.Client] = None,
         fallback: Optional[RuleBasedAdvisor] = None,
+        response_ttl: float = DEFAULT_RESPONSE_TTL,
     ) -> None:
         resolved_base_url = base_url or os.getenv("SNOWDAY_LLM_URL", "http://localhost:11434")
         self.base_url = resolved_base_url.rstrip("/")
         self.model = os.getenv("SNOWDAY_LLM_MODEL", model)
-        self.client = client or httpx.Client(timeout=timeout)
+        self._owns_client = client is None
+        self.client = client or httpx.Client(timeout=timeout, limits=LLM_LIMITS)
         self.fallback = fallback or RuleBasedAdvisor()
+        self.response_ttl = response_ttl
+        # (model, prompt) -> (monotonic expiry, generation)
+        self._responses: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+        self._responses_lock = threading.Lock()
         
         # Log initialization for debugging
         import logging
         logger = logging.getLogger(__name__)
         logger.info(f"LLMClient initialized: base_url={self.base_url}, model={self.model}, timeout={timeout}")
 
+    def close(self) -> None:
+        """Close the underlying HTTP client if this instance created it."""
+        if self._owns_client:
+            self.client.close()
+
+    def __enter__(self) -> "LLMClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def summarize_top_resorts(self, resorts: Sequence[ScoredResort], top_n: int = 3) -> str:
-        prompt = self._summary_prompt(resorts, top_n=top_n)
+        ranked = sorted(resorts, key=_BY_SCORE, reverse=True)
+        prompt = self._summary_prompt(ranked, top_n=top_n)
         output = self._generate(prompt)
         if output:
             return output
-        return self.fallback.summarize_top_resorts(resorts, top_n=top_n)
+        return self.fallback.summarize_top_resorts(ranked, top_n=top_n)
 
     def daily_recommendation(self, resorts: Sequence[ScoredResort]) -> str:
-        prompt = self._recommendation_prompt(resorts)
+        ranked = sorted(resorts, key=_BY_SCORE, reverse=True)
+        prompt = self._recommendation_prompt(ranked)
         output = self._generate(prompt)
         if output:
             return output
-        return self.fallback.daily_recommendation(resorts)
+        return self.fallback.daily_recommendation(ranked)
 
     def _generate(self, prompt: str) -> str:
+        key = (self.model, prompt)
+        now = time.monotonic()
+        with self._responses_lock:
+            cached = self._responses.get(key)
+            if cached is not None:
+                expires_at, output = cached
+                if expires_at > now:
+                    self._responses.move_to_end(key)
+                    return output
+                del self._responses[key]
+
+        output = self._request_generation(prompt)
+        # Only successful, non-empty generations are kept; failures and empty
+        # replies fall back to the advisor and are retried on the next request.
+        if output:
+            with self._responses_lock:
+                self._responses[key] = (now + self.response_ttl, output)
+                while len(self._responses) > _RESPONSE_CACHE_SIZE:
+                    self._responses.popitem(last=False)
+        return output or ""
+
+    def _request_generation(self, prompt: str) -> Optional[str]:
+        """POST the prompt to the model; ``None`` when the call fails."""
         import logging
         logger = logging.getLogger(__name__)
         
@@ -187,7 +246,7 @@ class LLMClient:
             
             response = self.client.post(url, json=payload)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             result = data.get("response", "")
             output = result.strip()
             
@@ -206,7 +265,7 @@ class LLMClient:
                 f"LLM request timed out after {self.client.timeout}s. "
                 f"URL: {self.base_url}, Model: {self.model}"
             )
-            return ""
+            return None
         except httpx.HTTPError as e:
             error_detail = ""
             if hasattr(e, "response") and e.response is not None:
@@ -218,19 +277,19 @@ class LLMClient:
                 f"LLM HTTP error: {type(e).__name__}: {e}{error_detail}. "
                 f"URL: {self.base_url}, Model: {self.model}"
             )
-            return ""
+            return None
         except ValueError as e:
             logger.warning(
                 f"LLM response parsing error: {type(e).__name__}: {e}. "
                 f"URL: {self.base_url}, Model: {self.model}"
             )
-            return ""
+            return None
         except Exception as e:
             logger.warning(
                 f"Unexpected LLM error: {type(e).__name__}: {e}. "
                 f"URL: {self.base_url}, Model: {self.model}"
             )
-            return ""
+            return None
 
     def _summary_prompt(self, resorts: Sequence[ScoredResort], *, top_n: int) -> str:
         formatted_rows = self._format_resorts(resorts)
@@ -270,13 +329,12 @@ class LLMClient:
         ).strip()
 
     def _format_resorts(self, resorts: Sequence[ScoredResort]) -> str:
-        """Format resorts into a detailed string for LLM prompts."""
+        """Format resorts, already ranked best-first, into a detailed string for LLM prompts."""
         if not resorts:
             return "No resort data available."
         
-        sorted_resorts = sorted(resorts, key=lambda r: r.score, reverse=True)
         lines = []
-        for resort in sorted_resorts:
+        for resort in resorts:
             # Build condition details
             conditions = []
             if resort.snowfall_24h is not None:
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, Mapping, Optional, Tuple
 
-from snow_day.config import app_config
+from snow_day.config import get_config
 from snow_day.models import ConditionSnapshot
 
 
@@ -261,7 +261,7 @@ def score_snapshot(
     reading for powder/icy determination.
     """
 
-    config = config or ScoringConfig.from_sources(config_data=app_config.scoring)
+    config = config or ScoringConfig.from_sources(config_data=get_config().scoring)
     previous_snapshot = None
     if previous_snapshots:
         previous_snapshot = list(previous_snapshots)[-1]
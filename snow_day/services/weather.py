@@ -4,8 +4,9 @@ from dataclasses import dataclass
 from typing import Optional
 
 import httpx
+import orjson
 
-from snow_day.http_client import DEFAULT_USER_AGENT
+from snow_day.http_client import get_shared_client
 
 OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
 
@@ -38,18 +39,10 @@ def fetch_current_weather(
         "wind_speed_unit": "mph",
     }
 
-    if client is not None:
-        response = client.get(OPEN_METEO_URL, params=params)
-    else:
-        response = httpx.get(
-            OPEN_METEO_URL,
-            params=params,
-            headers={"User-Agent": DEFAULT_USER_AGENT},
-            timeout=10.0,
-        )
+    response = (client or get_shared_client()).get(OPEN_METEO_URL, params=params)
 
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
     current = data.get("current") or {}
 
     return WeatherObservation(
@@ -3,7 +3,7 @@ from __future__ import annotations
 import sqlite3
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .models import ConditionSnapshot
 
@@ -57,7 +57,7 @@ class ConditionStore:
             self._ensure_column(conn, "snapshots", "trails_total INTEGER")
 
     def add_snapshot(self, snapshot: ConditionSnapshot) -> None:
-        data = snapshot.to_dict()
+        is_operational = snapshot.is_operational
         with self._connect() as conn:
             conn.execute(
                 """
@@ -68,22 +68,22 @@ class ConditionStore:
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
-                    data["resort_id"],
-                    data["timestamp"],
-                    data["wind_speed"],
-                    data["wind_chill"],
-                    data["temp_min"],
-                    data["temp_max"],
-                    data["snowfall_12h"],
-                    data["snowfall_24h"],
-                    data["snowfall_7d"],
-                    data["base_depth"],
-                    data.get("precip_type"),
-                    1 if data.get("is_operational") is True else 0 if data.get("is_operational") is False else None,
-                    data.get("lifts_open"),
-                    data.get("lifts_total"),
-                    data.get("trails_open"),
-                    data.get("trails_total"),
+                    snapshot.resort_id,
+                    snapshot.timestamp.isoformat(),
+                    snapshot.wind_speed,
+                    snapshot.wind_chill,
+                    snapshot.temp_min,
+                    snapshot.temp_max,
+                    snapshot.snowfall_12h,
+                    snapshot.snowfall_24h,
+                    snapshot.snowfall_7d,
+                    snapshot.base_depth,
+                    snapshot.precip_type,
+                    1 if is_operational is True else 0 if is_operational is False else None,
+                    snapshot.lifts_open,
+                    snapshot.lifts_total,
+                    snapshot.trails_open,
+                    snapshot.trails_total,
                 ),
             )
 
@@ -127,6 +127,46 @@ class ConditionStore:
 
         return [self._row_to_snapshot(row) for row in rows]
 
+    def latest_with_previous(
+        self, resort_ids: Iterable[str], previous: int = 4
+    ) -> Dict[str, Tuple[ConditionSnapshot, List[ConditionSnapshot]]]:
+        """Return each resort's latest snapshot and up to ``previous`` older ones.
+
+        All resorts are fetched with a single windowed query. Older snapshots are
+        ordered newest first; resorts without data are omitted.
+        """
+
+        ids = list(resort_ids)
+        if not ids:
+            return {}
+        placeholders = ",".join("?" * len(ids))
+        query = f"""
+            SELECT resort_id, timestamp, wind_speed, wind_chill, temp_min, temp_max,
+                   snowfall_12h, snowfall_24h, snowfall_7d, base_depth, precip_type,
+                   is_operational, lifts_open, lifts_total, trails_open, trails_total
+            FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY resort_id ORDER BY timestamp DESC
+                ) AS rn
+                FROM snapshots
+                WHERE resort_id IN ({placeholders})
+            )
+            WHERE rn <= ?
+            ORDER BY resort_id, rn
+        """
+        with self._connect() as conn:
+            rows = conn.execute(query, (*ids, previous + 1)).fetchall()
+
+        bundles: Dict[str, Tuple[ConditionSnapshot, List[ConditionSnapshot]]] = {}
+        for row in rows:
+            snapshot = self._row_to_snapshot(row)
+            bundle = bundles.get(snapshot.resort_id)
+            if bundle is None:
+                bundles[snapshot.resort_id] = (snapshot, [])
+            else:
+                bundle[1].append(snapshot)
+        return bundles
+
     def delete_snapshot(self, resort_id: str, timestamp: datetime) -> None:
         with self._connect() as conn:
             conn.execute(
@@ -212,25 +252,23 @@ class ConditionStore:
             trails_open,
             trails_total,
         ) = row
-        return ConditionSnapshot.from_dict(
-            {
-                "resort_id": resort_id,
-                "timestamp": timestamp,
-                "wind_speed": wind_speed,
-                "wind_chill": wind_chill,
-                "temp_min": temp_min,
-                "temp_max": temp_max,
-                "snowfall_12h": snowfall_12h,
-                "snowfall_24h": snowfall_24h,
-                "snowfall_7d": snowfall_7d,
-                "base_depth": base_depth,
-                "precip_type": precip_type,
-                "is_operational": bool(is_operational) if is_operational is not None else None,
-                "lifts_open": lifts_open,
-                "lifts_total": lifts_total,
-                "trails_open": trails_open,
-                "trails_total": trails_total,
-            }
+        return ConditionSnapshot(
+            resort_id=resort_id,
+            timestamp=datetime.fromisoformat(timestamp),
+            wind_speed=wind_speed,
+            wind_chill=wind_chill,
+            temp_min=temp_min,
+            temp_max=temp_max,
+            snowfall_12h=snowfall_12h,
+            snowfall_24h=snowfall_24h,
+            snowfall_7d=snowfall_7d,
+            base_depth=base_depth,
+            precip_type=precip_type,
+            is_operational=bool(is_operational) if is_operational is not None else None,
+            lifts_open=lifts_open,
+            lifts_total=lifts_total,
+            trails_open=trails_open,
+            trails_total=trails_total,
         )
 
     @staticmethod
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from snow_day.models import ConditionSnapshot
+from snow_day.storage import ConditionStore
+
+
+@pytest.fixture()
+def api(tmp_path, monkeypatch):
+    # The default ConditionStore lives under the working directory.
+    monkeypatch.chdir(tmp_path)
+    from snow_day import api as module
+
+    monkeypatch.setattr(module, "store", ConditionStore(tmp_path / "conditions.db"))
+    module._payload_cache.clear()
+    module._http_cache.cache_clear()
+    monkeypatch.setattr(module, "_conditions_body", None)
+    yield module
+    module._payload_cache.clear()
+    module._http_cache.cache_clear()
+
+
+def _snapshot(**overrides) -> ConditionSnapshot:
+    fields = {"resort_id": "killington", "timestamp": datetime(2024, 1, 1, tzinfo=timezone.utc), "base_depth": 30.0}
+    fields.update(overrides)
+    return ConditionSnapshot(**fields)
+
+
+def test_payload_cache_reuses_payloads_until_snapshot_changes(api) -> None:
+    snapshot = _snapshot()
+
+    (first,) = api._snapshots_to_payloads([snapshot])
+    (again,) = api._snapshots_to_payloads([replace(snapshot)])
+    assert again is first
+
+    # Weather fallback fills fields in place without moving the timestamp.
+    snapshot.temp_min = snapshot.temp_max = 20.0
+    (updated,) = api._snapshots_to_payloads([snapshot])
+    assert updated is not first
+    assert updated.temp_min == 20.0
+
+
+def test_payload_cache_invalidation_is_per_resort(api) -> None:
+    killington = _snapshot()
+    stowe = _snapshot(resort_id="stowe")
+    cached_killington, cached_stowe = api._snapshots_to_payloads([killington, stowe])
+
+    api._invalidate_payloads("killington")
+    rebuilt_killington, kept_stowe = api._snapshots_to_payloads([killington, stowe])
+
+    assert rebuilt_killington is not cached_killington
+    assert rebuilt_killington == cached_killington
+    assert kept_stowe is cached_stowe
+
+
+def test_importing_api_defers_config_and_llm_modules(tmp_path) -> None:
+    code = (
+        "import sys, snow_day.api; "
+        "print(sorted(m for m in ('yaml', 'dotenv', 'apscheduler', 'snow_day.services.llm_client') if m in sys.modules))"
+    )
+    env = {**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[1])}
+    result = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_http_cache_lives_next_to_condition_store(api) -> None:
+    assert api._http_cache().db_path == api.store.db_path.parent / "http_cache.db"
+
+
+def test_conditions_etag_revalidates_until_data_changes(api, monkeypatch) -> None:
+    from fastapi.testclient import TestClient
+
+    snapshot = _snapshot()
+    monkeypatch.setattr(api, "_latest_snapshots", lambda: [snapshot])
+    client = TestClient(api.app)
+
+    first = client.get("/conditions")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    repeat = client.get("/conditions", headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.headers["ETag"] == etag
+
+    # Weather fallback fills fields in without a new timestamp.
+    snapshot.temp_min = snapshot.temp_max = 20.0
+    changed = client.get("/conditions", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()["resorts"][0]["temp_min"] == 20.0
+
+
+def test_conditions_body_is_serialized_once_per_snapshot_set(api) -> None:
+    snapshot = _snapshot()
+    body, etag = api._conditions_body_and_etag([snapshot], snapshot.timestamp)
+
+    again, same_etag = api._conditions_body_and_etag([replace(snapshot)], snapshot.timestamp)
+    assert again is body
+    assert same_etag == etag
+
+    api._invalidate_payloads("killington")
+    rebuilt, rebuilt_etag = api._conditions_body_and_etag([snapshot], snapshot.timestamp)
+    assert rebuilt is not body
+    assert (rebuilt, rebuilt_etag) == (body, etag)
+
+
+def test_llm_client_is_built_once_under_concurrent_first_use(api, monkeypatch) -> None:
+    from snow_day.services import llm_client
+
+    built = []
+
+    class SlowClient:
+        def __init__(self) -> None:
+            time.sleep(0.05)
+            built.append(self)
+
+    monkeypatch.setattr(llm_client, "LLMClient", SlowClient)
+    monkeypatch.setattr(api, "_llm_client", None)
+    barrier = threading.Barrier(4)
+
+    def first_use():
+        barrier.wait()
+        return api._llm()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        clients = list(pool.map(lambda _: first_use(), range(4)))
+
+    assert len(built) == 1
+    assert all(client is built[0] for client in clients)
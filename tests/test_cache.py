@@ -0,0 +1,68 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from snow_day.cache import LastModifiedCache
+from snow_day.models import ConditionSnapshot
+
+
+def test_conditional_headers_include_validators():
+    cache = LastModifiedCache()
+    snapshot = ConditionSnapshot(resort_id="alpine_peak", timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    assert cache.get_conditional_headers("https://example.com") == {}
+
+    cache.update("https://example.com", "Wed, 01 Jan 2024 00:00:00 GMT", snapshot, etag='"v1"')
+
+    assert cache.get_conditional_headers("https://example.com") == {
+        "If-Modified-Since": "Wed, 01 Jan 2024 00:00:00 GMT",
+        "If-None-Match": '"v1"',
+    }
+    assert cache.get_snapshot("https://example.com") is snapshot
+
+
+def test_persistent_cache_survives_reload(tmp_path: Path):
+    db_path = tmp_path / "http_cache.db"
+    snapshot = ConditionSnapshot(
+        resort_id="alpine_peak",
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        base_depth=42.0,
+        is_operational=True,
+    )
+
+    LastModifiedCache(db_path).update("https://example.com", None, snapshot, etag='"v1"')
+    reloaded = LastModifiedCache(db_path)
+
+    assert reloaded.get_conditional_headers("https://example.com") == {"If-None-Match": '"v1"'}
+    assert reloaded.get_snapshot("https://example.com") == snapshot
+
+
+def test_concurrent_first_lookups_wait_for_persisted_entries(tmp_path: Path, monkeypatch):
+    db_path = tmp_path / "http_cache.db"
+    writer = LastModifiedCache(db_path)
+    urls = [f"https://example.com/{index}" for index in range(8)]
+    for url in urls:
+        snapshot = ConditionSnapshot(resort_id="alpine_peak", timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc))
+        writer.update(url, None, snapshot, etag=f'"{url}"')
+
+    cold = LastModifiedCache(db_path)
+    read_entries = cold._read_entries
+
+    def slow_read_entries():
+        # Widen the window in which other threads could see a half-loaded cache.
+        time.sleep(0.05)
+        return read_entries()
+
+    monkeypatch.setattr(cold, "_read_entries", slow_read_entries)
+    barrier = threading.Barrier(len(urls))
+
+    def lookup(url: str):
+        barrier.wait()
+        return cold.get_conditional_headers(url)
+
+    with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        results = list(pool.map(lookup, urls))
+
+    assert results == [{"If-None-Match": f'"{url}"'} for url in urls]
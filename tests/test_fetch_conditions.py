@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable
 
@@ -7,8 +11,8 @@ import httpx
 import pytest
 
 from snow_day.cache import LastModifiedCache
-from snow_day.scrapers import fetch_conditions
-from snow_day.scrapers import alpine_peak, summit_valley
+from snow_day.scrapers import fetch_all, fetch_conditions, fetch_conditions_async
+from snow_day.scrapers import alpine_peak, ragged_mountain, summit_valley
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -85,6 +89,304 @@ def test_last_modified_caching_uses_snapshot() -> None:
     assert second_snapshot is first_snapshot
 
 
+def test_etag_caching_sends_if_none_match() -> None:
+    html = '<h6>Last 24 hrs.</h6> <h3>3"</h3>'
+    etag = '"abc123"'
+    call_count = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        call_count["count"] += 1
+        if call_count["count"] == 1:
+            return httpx.Response(200, text=html, headers={"ETag": etag})
+        assert request.headers.get("If-None-Match") == etag
+        assert "If-Modified-Since" not in request.headers
+        return httpx.Response(304, headers={"ETag": etag})
+
+    client = httpx.Client(transport=_make_mock_transport(handler))
+    cache = LastModifiedCache()
+
+    first_snapshot = fetch_conditions(ragged_mountain.RESORT_ID, client=client, cache=cache)
+    second_snapshot = fetch_conditions(ragged_mountain.RESORT_ID, client=client, cache=cache)
+
+    assert call_count["count"] == 2
+    assert second_snapshot is first_snapshot
+
+
+def test_fetch_conditions_async_parses_and_caches() -> None:
+    html = '<h6>Last 24 hrs.</h6> <h3>3"</h3> <h6>Current Base</h6> <h3>20"</h3>'
+    last_modified = "Wed, 01 Jan 2024 00:00:00 GMT"
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("If-Modified-Since"))
+        if len(seen_headers) == 1:
+            return httpx.Response(200, text=html, headers={"Last-Modified": last_modified})
+        return httpx.Response(304)
+
+    async def run():
+        client = httpx.AsyncClient(transport=_make_mock_transport(handler))
+        cache = LastModifiedCache()
+        first = await fetch_conditions_async(ragged_mountain.RESORT_ID, client=client, cache=cache)
+        second = await fetch_conditions_async(ragged_mountain.RESORT_ID, client=client, cache=cache)
+        await client.aclose()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first.snowfall_24h == 3
+    assert first.base_depth == 20
+    assert second is first
+    assert seen_headers == [None, last_modified]
+
+
+def test_fetch_conditions_async_coalesces_concurrent_requests() -> None:
+    html = '<h6>Last 24 hrs.</h6> <h3>3"</h3> <h6>Current Base</h6> <h3>20"</h3>'
+    call_count = {"count": 0}
+
+    async def handler(_: httpx.Request) -> httpx.Response:
+        call_count["count"] += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, text=html)
+
+    async def run():
+        client = httpx.AsyncClient(transport=_make_mock_transport(handler))
+        cache = LastModifiedCache()
+        results = await asyncio.gather(
+            *(fetch_conditions_async(ragged_mountain.RESORT_ID, client=client, cache=cache) for _ in range(3))
+        )
+        await client.aclose()
+        return results
+
+    results = asyncio.run(run())
+
+    assert call_count["count"] == 1
+    assert all(snapshot == results[0] for snapshot in results)
+    # Each follower gets its own copy to fill in.
+    assert len({id(snapshot) for snapshot in results}) == 3
+    assert results[0].base_depth == 20
+
+
+def test_fetch_conditions_async_followers_keep_their_timestamp() -> None:
+    html = '<h6>Last 24 hrs.</h6> <h3>3"</h3> <h6>Current Base</h6> <h3>20"</h3>'
+    leader_ts = datetime(2024, 1, 1, 6, 0, tzinfo=timezone.utc)
+    follower_ts = datetime(2024, 1, 1, 7, 0, tzinfo=timezone.utc)
+
+    async def handler(_: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, text=html)
+
+    async def run():
+        client = httpx.AsyncClient(transport=_make_mock_transport(handler))
+        cache = LastModifiedCache()
+        results = await asyncio.gather(
+            fetch_conditions_async(ragged_mountain.RESORT_ID, client=client, cache=cache, timestamp=leader_ts),
+            fetch_conditions_async(ragged_mountain.RESORT_ID, client=client, cache=cache, timestamp=follower_ts),
+        )
+        await client.aclose()
+        return results
+
+    leader, follower = asyncio.run(run())
+
+    assert leader.timestamp == leader_ts
+    assert follower.timestamp == follower_ts
+    assert follower.base_depth == 20
+
+
+def test_fetch_conditions_async_does_not_coalesce_across_caches() -> None:
+    html = '<h6>Last 24 hrs.</h6> <h3>3"</h3> <h6>Current Base</h6> <h3>20"</h3>'
+    call_count = {"count": 0}
+
+    async def handler(_: httpx.Request) -> httpx.Response:
+        call_count["count"] += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, text=html)
+
+    async def run():
+        client = httpx.AsyncClient(transport=_make_mock_transport(handler))
+        await asyncio.gather(
+            *(
+                fetch_conditions_async(ragged_mountain.RESORT_ID, client=client, cache=LastModifiedCache())
+                for _ in range(2)
+            )
+        )
+        await client.aclose()
+
+    asyncio.run(run())
+
+    assert call_count["count"] == 2
+
+
+def test_fetch_conditions_async_follower_survives_leader_cancellation() -> None:
+    html = '<h6>Last 24 hrs.</h6> <h3>3"</h3> <h6>Current Base</h6> <h3>20"</h3>'
+    call_count = {"count": 0}
+
+    async def handler(_: httpx.Request) -> httpx.Response:
+        call_count["count"] += 1
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, text=html)
+
+    async def run():
+        client = httpx.AsyncClient(transport=_make_mock_transport(handler))
+        cache = LastModifiedCache()
+        leader = asyncio.create_task(fetch_conditions_async(ragged_mountain.RESORT_ID, client=client, cache=cache))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(fetch_conditions_async(ragged_mountain.RESORT_ID, client=client, cache=cache))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        snapshot = await follower
+        await client.aclose()
+        return leader, snapshot
+
+    leader, snapshot = asyncio.run(run())
+
+    assert leader.cancelled()
+    assert snapshot.base_depth == 20
+    assert call_count["count"] == 2
+
+
+def test_fetch_all_returns_snapshots_and_errors_per_resort() -> None:
+    html = '<h6>Last 24 hrs.</h6> <h3>3"</h3> <h6>Current Base</h6> <h3>20"</h3>'
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=html)
+
+    async def run():
+        client = httpx.AsyncClient(transport=_make_mock_transport(handler))
+        results = await fetch_all([ragged_mountain.RESORT_ID, "missing"], client=client)
+        await client.aclose()
+        return results
+
+    results = asyncio.run(run())
+
+    assert results[ragged_mountain.RESORT_ID].base_depth == 20
+    assert isinstance(results["missing"], KeyError)
+
+
+def test_fetch_conditions_uses_caller_timestamp() -> None:
+    html = '<h6>Last 24 hrs.</h6> <h3>3"</h3> <h6>Current Base</h6> <h3>20"</h3>'
+    timestamp = datetime(2024, 1, 1, 6, 0, tzinfo=timezone.utc)
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=html)
+
+    client = httpx.Client(transport=_make_mock_transport(handler))
+    snapshot = fetch_conditions(
+        ragged_mountain.RESORT_ID, client=client, cache=LastModifiedCache(), timestamp=timestamp
+    )
+
+    assert snapshot.timestamp == timestamp
+
+
+def test_fetch_conditions_follower_wait_is_bounded_by_client_timeout() -> None:
+    html = '<h6>Last 24 hrs.</h6> <h3>3"</h3> <h6>Current Base</h6> <h3>20"</h3>'
+    started = threading.Event()
+    release = threading.Event()
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        # The mock transport ignores timeouts, so the leader hangs until released.
+        started.set()
+        release.wait(5)
+        return httpx.Response(200, text=html)
+
+    client = httpx.Client(transport=_make_mock_transport(handler), timeout=0.01)
+    cache = LastModifiedCache()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        leader = pool.submit(fetch_conditions, ragged_mountain.RESORT_ID, client=client, cache=cache)
+        assert started.wait(5)
+        try:
+            with pytest.raises(TimeoutError):
+                fetch_conditions(ragged_mountain.RESORT_ID, client=client, cache=cache)
+        finally:
+            release.set()
+        assert leader.result().base_depth == 20.0
+
+
+def test_unchanged_last_modified_skips_reparse() -> None:
+    html = '<h6>Last 24 hrs.</h6> <h3>3"</h3> <h6>Current Base</h6> <h3>20"</h3>'
+    last_modified = "Wed, 01 Jan 2024 00:00:00 GMT"
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        # Server ignores If-Modified-Since and always answers 200.
+        return httpx.Response(200, text=html, headers={"Last-Modified": last_modified})
+
+    client = httpx.Client(transport=_make_mock_transport(handler))
+    cache = LastModifiedCache()
+
+    first = fetch_conditions(ragged_mountain.RESORT_ID, client=client, cache=cache)
+    second = fetch_conditions(ragged_mountain.RESORT_ID, client=client, cache=cache)
+
+    assert second is first
+
+
+def test_identical_body_skips_reparse() -> None:
+    html = '<h6>Last 24 hrs.</h6> <h3>3"</h3> <h6>Current Base</h6> <h3>20"</h3>'
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        # No validators at all: only the body tells us nothing changed.
+        return httpx.Response(200, text=html)
+
+    client = httpx.Client(transport=_make_mock_transport(handler))
+    cache = LastModifiedCache()
+
+    first = fetch_conditions(ragged_mountain.RESORT_ID, client=client, cache=cache)
+    second = fetch_conditions(ragged_mountain.RESORT_ID, client=client, cache=cache)
+
+    assert second is first
+
+
 def test_unknown_resort_error() -> None:
     with pytest.raises(KeyError):
         fetch_conditions("missing", client=httpx.Client(transport=_make_mock_transport(lambda _: httpx.Response(404))))
+
+
+def test_caller_client_without_cache_gets_a_fresh_cache() -> None:
+    html = '<h6>Last 24 hrs.</h6> <h3>3"</h3> <h6>Current Base</h6> <h3>20"</h3>'
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("If-Modified-Since"))
+        return httpx.Response(200, text=html, headers={"Last-Modified": "Wed, 01 Jan 2024 00:00:00 GMT"})
+
+    for _ in range(2):
+        fetch_conditions(ragged_mountain.RESORT_ID, client=httpx.Client(transport=_make_mock_transport(handler)))
+
+    # Neither call sees validators stored by the other client.
+    assert seen_headers == [None, None]
+
+
+def test_cached_scraper_settings_ignore_later_override_mutation(monkeypatch) -> None:
+    from snow_day import scrapers
+    from snow_day.config import ScraperSettings, get_config
+
+    override = {"wind": ".custom-wind"}
+    monkeypatch.setitem(
+        get_config().scrapers,
+        summit_valley.RESORT_ID,
+        ScraperSettings(report_url="https://example.com/summit", selectors=override),
+    )
+    scrapers._settings_for.cache_clear()
+    try:
+        settings = scrapers._settings_for(summit_valley.RESORT_ID)
+        override["wind"] = ".mutated"
+        override["base"] = ".mutated"
+
+        assert settings.selectors["wind"] == ".custom-wind"
+        assert settings.selectors["base"] == summit_valley.DEFAULT_SELECTORS["base"]
+        assert scrapers._settings_for(summit_valley.RESORT_ID) is settings
+        with pytest.raises(TypeError):
+            settings.selectors["wind"] = ".other"  # type: ignore[index]
+    finally:
+        scrapers._settings_for.cache_clear()
+
+
+def test_single_resort_lookup_shares_the_registry_instance(monkeypatch) -> None:
+    from snow_day import scrapers
+
+    monkeypatch.setattr(scrapers, "_SCRAPERS", None)
+    monkeypatch.setattr(scrapers, "_RESOLVED", {})
+
+    single = scrapers._scraper_for(ragged_mountain.RESORT_ID)
+    assert scrapers._scraper_for("not-a-resort") is None
+    assert "not-a-resort" not in scrapers._RESOLVED
+
+    assert scrapers.get_scrapers()[ragged_mountain.RESORT_ID] is single
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import httpx
+
+from snow_day.services import llm_client
+from snow_day.services.llm_client import LLMClient
+
+
+def _client(handler, **kwargs) -> LLMClient:
+    return LLMClient(
+        base_url="http://llm.test",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+
+
+def test_repeated_prompt_reuses_generation() -> None:
+    prompts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        prompts.append(request.content)
+        return httpx.Response(200, json={"response": f"answer {len(prompts)}"})
+
+    client = _client(handler)
+
+    assert client._generate("best resort?") == "answer 1"
+    assert client._generate("best resort?") == "answer 1"
+    assert len(prompts) == 1
+
+    # A different prompt or model is a miss.
+    assert client._generate("backup resort?") == "answer 2"
+    client.model = "other-model"
+    assert client._generate("best resort?") == "answer 3"
+    assert len(prompts) == 3
+
+
+def test_failed_or_empty_generations_are_not_cached() -> None:
+    responses = [
+        httpx.Response(500),
+        httpx.Response(200, json={"response": "   "}),
+        httpx.Response(200, json={"response": "Go to Stowe"}),
+    ]
+    calls = []
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return responses[len(calls) - 1]
+
+    client = _client(handler)
+
+    assert client._generate("prompt") == ""
+    assert client._generate("prompt") == ""
+    assert client._generate("prompt") == "Go to Stowe"
+    assert client._generate("prompt") == "Go to Stowe"
+    assert len(calls) == 3
+
+
+def test_cached_generation_expires(monkeypatch) -> None:
+    calls = []
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(200, json={"response": f"answer {len(calls)}"})
+
+    now = [1000.0]
+    monkeypatch.setattr(llm_client.time, "monotonic", lambda: now[0])
+    client = _client(handler, response_ttl=60.0)
+
+    assert client._generate("prompt") == "answer 1"
+    now[0] += 59.0
+    assert client._generate("prompt") == "answer 1"
+    now[0] += 2.0
+    assert client._generate("prompt") == "answer 2"
+    assert len(calls) == 2
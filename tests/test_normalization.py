@@ -40,3 +40,23 @@ def test_normalizer_converts_units_and_fields():
     assert snapshot.base_depth == pytest.approx(47.24412)
     assert snapshot.precip_type == "snow"
     assert snapshot.timestamp == timestamp
+
+
+def test_normalize_batch_matches_single_normalize():
+    normalizer = ConditionNormalizer(
+        mappings={
+            "metric_hill": {
+                "wind_speed": FieldMapping("wind_kph", converter=ConditionNormalizer._kph_to_mph),
+                "base_depth": FieldMapping("base_cm", converter=ConditionNormalizer._cm_to_inches),
+            }
+        }
+    )
+
+    timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    payloads = [{"wind_kph": 20, "base_cm": 120}, {"wind_kph": None}, {}]
+    snapshots = normalizer.normalize_batch("metric_hill", payloads, timestamp=timestamp)
+
+    assert snapshots == [normalizer.normalize("metric_hill", payload, timestamp=timestamp) for payload in payloads]
+    assert snapshots[0].wind_speed == pytest.approx(12.42742)
+    assert snapshots[1].wind_speed is None
+    assert all(snapshot.timestamp == timestamp for snapshot in snapshots)
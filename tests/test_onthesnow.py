@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from snow_day.scrapers import bolton_valley
+from snow_day.scrapers.base import parse_onthesnow
+
+
+def test_open_counts_match_any_case() -> None:
+    html = (
+        "<html><body>"
+        "<div>Lifts Open</div><div>5 of 12</div>"
+        "<div>24 of 80</div><div>TRAILS OPEN</div>"
+        "</body></html>"
+    )
+
+    metrics = parse_onthesnow(html)
+
+    assert (metrics["lifts_open"], metrics["lifts_total"]) == (5, 12)
+    assert (metrics["trails_open"], metrics["trails_total"]) == (24, 80)
+    assert metrics["is_operational"] is True
+
+
+def test_open_counts_single_value_mixed_case() -> None:
+    metrics = parse_onthesnow("<p>oPeN LiFtS 3</p><p>Runs Open 17</p>")
+
+    assert (metrics["lifts_open"], metrics["lifts_total"]) == (3, None)
+    assert (metrics["trails_open"], metrics["trails_total"]) == (17, None)
+
+
+def test_memoized_page_yields_distinct_stamped_snapshots() -> None:
+    html = "<div>Base 40\" Packed Powder</div><div>Lifts Open 5 of 12</div>"
+    morning = datetime(2024, 1, 1, 6, 0, tzinfo=timezone.utc)
+    evening = datetime(2024, 1, 1, 18, 0, tzinfo=timezone.utc)
+
+    first = bolton_valley.parse_conditions(html, timestamp=morning)
+    second = bolton_valley.parse_conditions(html, timestamp=evening)
+
+    assert first is not second
+    assert first.timestamp == morning
+    assert second.timestamp == evening
+    assert first.base_depth == second.base_depth == 40
+
+    # Filling one snapshot in (as the weather fallback does) leaves the other alone.
+    first.temp_min = 10.0
+    assert second.temp_min is None
+    assert bolton_valley.parse_conditions(html, timestamp=evening).temp_min is None
+
+
+def test_memoized_metrics_are_copied_per_call() -> None:
+    html = "<div>Base 40\" Packed Powder</div>"
+
+    metrics = parse_onthesnow(html)
+    metrics["base_depth_in"] = 0
+
+    assert parse_onthesnow(html)["base_depth_in"] == 40
@@ -64,3 +64,21 @@ def test_prune_respects_age_and_keep_last(tmp_path: Path):
     remaining = store.list_snapshots("summit_valley")
     assert len(remaining) == 1
     assert remaining[0].timestamp == snapshots[-1].timestamp
+
+
+def test_latest_with_previous_batches_resorts(tmp_path: Path):
+    store = ConditionStore(tmp_path / "conditions.db")
+
+    base = datetime(2024, 2, 1, tzinfo=timezone.utc)
+    for hours in range(6):
+        store.add_snapshot(build_snapshot("alpine_peak", timestamp=base + timedelta(hours=hours)))
+    store.add_snapshot(build_snapshot("summit_valley", timestamp=base))
+
+    bundles = store.latest_with_previous(["alpine_peak", "summit_valley", "missing"], previous=4)
+
+    assert set(bundles) == {"alpine_peak", "summit_valley"}
+    latest, previous = bundles["alpine_peak"]
+    expected = store.list_snapshots("alpine_peak", limit=5)
+    assert latest == expected[0]
+    assert previous == expected[1:]
+    assert bundles["summit_valley"][1] == []